@@ -1,3 +1,7 @@
+import os
+import signal
+import subprocess
+
 class DockerStep:
     """Base class for Docker steps with execute and rollback functionality."""
     def __init__(self, description, worker):
@@ -13,6 +17,27 @@ class DockerStep:
         """Roll back the step."""
         raise NotImplementedError("Subclasses must implement rollback()")
 
+    def wait_for_process(self, process, interval=0.1, kill_group=False):
+        """Wait for a subprocess, terminating it promptly if the worker is cancelled.
+        
+        Pass kill_group=True for processes started with start_new_session=True so the
+        whole process group (e.g. everything a shell spawned) is terminated.
+        """
+        while True:
+            try:
+                return process.wait(timeout=interval)
+            except subprocess.TimeoutExpired:
+                if self.worker.cancelled:
+                    if kill_group:
+                        try:
+                            os.killpg(process.pid, signal.SIGTERM)
+                        except ProcessLookupError:
+                            pass  # Group already exited
+                    else:
+                        process.terminate()
+                    process.wait()
+                    raise Exception("Installation cancelled by user")
+
 class InstallationStep(DockerStep):
     """Base class for installation steps that can be executed and rolled back."""
     def __init__(self, description, worker):
@@ -1,10 +1,125 @@
 import os
+import re
 import subprocess
 import tempfile
 from .base import InstallationStep
 
+_SCRIPT_HEADER = """#!/bin/bash
+set -e
+
+echo 'Starting Docker installation...'
+"""
+
+_SCRIPT_FOOTER = """
+echo 'Docker installation completed successfully'
+"""
+
+# Per-family install scripts; {add_user} and {auto_start} take that family's snippets below
+_DISTRO_SCRIPTS = {
+    "debian": _SCRIPT_HEADER + """
+# Remove old versions if any
+apt-get remove -y docker docker-engine docker.io containerd runc 2>/dev/null || true
+
+# Update apt repos
+apt-get update
+
+# Install dependencies
+apt-get install -y \\
+    apt-transport-https \\
+    ca-certificates \\
+    curl \\
+    gnupg \\
+    lsb-release
+
+# Add Docker's official GPG key
+curl -fsSL https://download.docker.com/linux/ubuntu/gpg | gpg --dearmor -o /usr/share/keyrings/docker-archive-keyring.gpg
+
+# Add repository
+echo "deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/docker-archive-keyring.gpg] \\
+    https://download.docker.com/linux/ubuntu $(lsb_release -cs) stable" | tee /etc/apt/sources.list.d/docker.list > /dev/null
+
+# Install Docker Engine
+apt-get update
+apt-get install -y docker-ce docker-ce-cli containerd.io
+
+# Configure Docker to start on boot
+systemctl enable docker
+{add_user}{auto_start}""" + _SCRIPT_FOOTER,
+    "fedora": _SCRIPT_HEADER + """
+# Remove old versions if any
+dnf remove -y docker docker-client docker-client-latest docker-common docker-latest docker-latest-logrotate docker-logrotate docker-engine podman 2>/dev/null || true
+
+# Install required packages
+dnf -y install dnf-plugins-core
+
+# Add Docker repo
+dnf config-manager --add-repo https://download.docker.com/linux/fedora/docker-ce.repo
+
+# Install Docker
+dnf install -y docker-ce docker-ce-cli containerd.io
+
+# Configure Docker to start on boot
+systemctl enable docker
+{add_user}{auto_start}""" + _SCRIPT_FOOTER,
+    "_default": _SCRIPT_HEADER + """
+# Using convenience script for other distributions
+curl -fsSL https://get.docker.com -o get-docker.sh
+sh get-docker.sh
+
+# Configure Docker to start on boot
+systemctl enable docker 2>/dev/null || true
+{add_user}{auto_start}""" + _SCRIPT_FOOTER,
+}
+
+_OS_RELEASE_PATH = "/etc/os-release"
+_OS_RELEASE_RE = re.compile(rb'^([A-Z_]+)=(?:"([^"\n]*)"|([^\n]*))$', re.M)
+
+# Release files probed when os-release is missing, in priority order
+_DISTRO_FALLBACKS = (
+    ("/etc/debian_version", "debian"),
+    ("/etc/fedora-release", "fedora"),
+    ("/etc/centos-release", "centos"),
+    ("/etc/redhat-release", "rhel"),
+)
+
+_DISTRO_FAMILIES = {
+    "ubuntu": "debian",
+    "debian": "debian",
+    "fedora": "fedora",
+    "centos": "fedora",
+    "rhel": "fedora",
+}
+
+# Optional script snippets per family; only the generic script tolerates failures
+_STRICT_ADD_USER = """
+# Add current user to docker group
+usermod -aG docker $SUDO_USER
+"""
+_STRICT_AUTO_START = """
+# Start Docker service
+systemctl start docker
+"""
+_ADD_USER_SNIPPETS = {
+    "debian": _STRICT_ADD_USER,
+    "fedora": _STRICT_ADD_USER,
+    "_default": """
+# Add current user to docker group
+usermod -aG docker $SUDO_USER 2>/dev/null || usermod -aG docker $USER
+""",
+}
+_AUTO_START_SNIPPETS = {
+    "debian": _STRICT_AUTO_START,
+    "fedora": _STRICT_AUTO_START,
+    "_default": """
+# Start Docker service
+systemctl start docker 2>/dev/null || service docker start
+""",
+}
+
 class DetectDistroStep(InstallationStep):
     """Detects Linux distribution."""
+    _distro_cache = None  # Shared across instances; the distribution can't change at runtime
+    
     def __init__(self, worker):
         super().__init__("Detecting Linux Distribution", worker)
         self.distro = None
@@ -12,7 +127,7 @@ class DetectDistroStep(InstallationStep):
     def execute(self):
         """Detect the Linux distribution."""
         self.worker.log_message.emit("Detecting Linux distribution...")
-        self.distro = self._get_linux_distro()
+        self.distro = self.detect_distro()
         if not self.distro or self.distro == "unknown":
             self.worker.log_message.emit("ERROR: Could not determine Linux distribution")
             raise Exception("Could not determine Linux distribution")
@@ -23,28 +138,30 @@ class DetectDistroStep(InstallationStep):
         """Nothing to roll back for detection."""
         pass
     
-    def _get_linux_distro(self):
-        """Helper method to detect the Linux distribution."""
+    @classmethod
+    def detect_distro(cls):
+        """Detect the Linux distribution once and cache the result."""
+        if cls._distro_cache:
+            return cls._distro_cache
+        
         try:
-            if os.path.exists("/etc/os-release"):
-                with open("/etc/os-release") as f:
-                    for line in f:
-                        if line.startswith("ID="):
-                            return line.split("=")[1].strip().strip('"')
-            
+            with open(_OS_RELEASE_PATH, "rb") as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        release = {key: quoted or bare for key, quoted, bare in _OS_RELEASE_RE.findall(data)}
+        distro = release.get(b"ID", b"").strip().decode("ascii", "replace")
+        
+        if not distro:
             # Fallbacks
-            if os.path.exists("/etc/debian_version"):
-                return "debian"
-            elif os.path.exists("/etc/fedora-release"):
-                return "fedora"
-            elif os.path.exists("/etc/centos-release"):
-                return "centos"
-            elif os.path.exists("/etc/redhat-release"):
-                return "rhel"
-                
-            return "unknown"
-        except:
-            return "unknown"
+            distro = "unknown"
+            for path, name in _DISTRO_FALLBACKS:
+                if os.access(path, os.F_OK):
+                    distro = name
+                    break
+        
+        cls._distro_cache = distro
+        return distro
 
 class DockerPackageStep(InstallationStep):
     """Installs Docker packages on Linux."""
@@ -59,34 +176,21 @@ class DockerPackageStep(InstallationStep):
     def execute(self):
         """Install Docker packages based on the distribution."""
         self.worker.log_message.emit("Preparing Docker installation...")
+        if self.distro is None:
+            self.distro = DetectDistroStep.detect_distro()
         
-        # Create installation script
-        with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".sh") as script_file:
-            self.installation_script = script_file.name
+        # Create installation script in a private directory removed on exit
+        with tempfile.TemporaryDirectory(prefix="docker_install_") as temp_dir:
+            self.installation_script = os.path.join(temp_dir, "install_docker.sh")
+            with open(self.installation_script, "w") as script_file:
+                script_file.write(self._build_script())
             
-            script_file.write("#!/bin/bash\n")
-            script_file.write("set -e\n\n")
-            script_file.write("echo 'Starting Docker installation...'\n\n")
+            # Make script executable
+            os.chmod(self.installation_script, 0o755)
+            
+            # Run script with sudo
+            self.worker.log_message.emit("Installing Docker (requires sudo)...")
             
-            if self.distro in ["ubuntu", "debian"]:
-                # Ubuntu/Debian installation
-                self._write_debian_script(script_file)
-            elif self.distro in ["fedora", "centos", "rhel"]:
-                # Fedora/CentOS/RHEL installation
-                self._write_fedora_script(script_file)
-            else:
-                # Generic Linux installation
-                self._write_generic_script(script_file)
-                
-            script_file.write("\necho 'Docker installation completed successfully'\n")
-        
-        # Make script executable
-        os.chmod(self.installation_script, 0o755)
-        
-        # Run script with sudo
-        self.worker.log_message.emit("Installing Docker (requires sudo)...")
-        
-        try:
             with subprocess.Popen(
                 ["sudo", self.installation_script],
                 stdout=subprocess.PIPE,
@@ -109,10 +213,6 @@ class DockerPackageStep(InstallationStep):
                     raise Exception(f"Installation failed with code {process.returncode}")
                 
                 self.installation_successful = True
-        finally:
-            # Clean up script
-            if os.path.exists(self.installation_script):
-                os.unlink(self.installation_script)
     
     def rollback(self):
         """Roll back the Docker installation."""
@@ -122,155 +222,55 @@ class DockerPackageStep(InstallationStep):
         
         self.worker.log_message.emit("Rolling back Docker installation...")
         
-        # Create uninstallation script
-        with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".sh") as script_file:
-            uninstall_script = script_file.name
+        with tempfile.TemporaryDirectory(prefix="docker_uninstall_") as temp_dir:
+            # Create uninstallation script
+            uninstall_script = os.path.join(temp_dir, "uninstall_docker.sh")
+            with open(uninstall_script, "w") as script_file:
+                script_file.write("#!/bin/bash\n")
+                script_file.write("set -e\n\n")
+                script_file.write("echo 'Uninstalling Docker...'\n\n")
+                
+                if self.distro in ["ubuntu", "debian"]:
+                    script_file.write("apt-get remove -y docker-ce docker-ce-cli containerd.io\n")
+                    script_file.write("apt-get purge -y docker-ce docker-ce-cli containerd.io\n")
+                    script_file.write("apt-get autoremove -y\n")
+                elif self.distro in ["fedora", "centos", "rhel"]:
+                    script_file.write("dnf remove -y docker-ce docker-ce-cli containerd.io\n")
+                else:
+                    script_file.write("# Generic uninstall\n")
+                    script_file.write("if command -v docker > /dev/null; then\n")
+                    script_file.write("    systemctl stop docker 2>/dev/null || true\n")
+                    script_file.write("    which docker-compose && rm -f $(which docker-compose) || true\n")
+                    script_file.write("    which docker && rm -f $(which docker) || true\n")
+                    script_file.write("fi\n")
+                
+                script_file.write("\necho 'Docker uninstallation completed'\n")
             
-            script_file.write("#!/bin/bash\n")
-            script_file.write("set -e\n\n")
-            script_file.write("echo 'Uninstalling Docker...'\n\n")
+            # Make script executable
+            os.chmod(uninstall_script, 0o755)
             
-            if self.distro in ["ubuntu", "debian"]:
-                script_file.write("apt-get remove -y docker-ce docker-ce-cli containerd.io\n")
-                script_file.write("apt-get purge -y docker-ce docker-ce-cli containerd.io\n")
-                script_file.write("apt-get autoremove -y\n")
-            elif self.distro in ["fedora", "centos", "rhel"]:
-                script_file.write("dnf remove -y docker-ce docker-ce-cli containerd.io\n")
-            else:
-                script_file.write("# Generic uninstall\n")
-                script_file.write("if command -v docker > /dev/null; then\n")
-                script_file.write("    systemctl stop docker 2>/dev/null || true\n")
-                script_file.write("    which docker-compose && rm -f $(which docker-compose) || true\n")
-                script_file.write("    which docker && rm -f $(which docker) || true\n")
-                script_file.write("fi\n")
-            
-            script_file.write("\necho 'Docker uninstallation completed'\n")
-        
-        # Make script executable
-        os.chmod(uninstall_script, 0o755)
-        
-        try:
-            # Run uninstallation script with sudo
-            with subprocess.Popen(
-                ["sudo", uninstall_script],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
-            ) as process:
-                for line in process.stdout:
-                    self.worker.log_message.emit(line.strip())
-                process.wait()
-        except Exception as e:
-            self.worker.log_message.emit(f"Warning: Error during Docker uninstallation: {str(e)}")
-        finally:
-            # Clean up uninstallation script
-            if os.path.exists(uninstall_script):
-                os.unlink(uninstall_script)
-    
-    def _write_debian_script(self, script_file):
-        """Write Debian/Ubuntu-specific installation script."""
-        script_file.write("""
-# Remove old versions if any
-apt-get remove -y docker docker-engine docker.io containerd runc 2>/dev/null || true
-
-# Update apt repos
-apt-get update
-
-# Install dependencies
-apt-get install -y \\
-    apt-transport-https \\
-    ca-certificates \\
-    curl \\
-    gnupg \\
-    lsb-release
-
-# Add Docker's official GPG key
-curl -fsSL https://download.docker.com/linux/ubuntu/gpg | gpg --dearmor -o /usr/share/keyrings/docker-archive-keyring.gpg
-
-# Add repository
-echo "deb [arch=$(dpkg --print-architecture) signed-by=/usr/share/keyrings/docker-archive-keyring.gpg] \\
-    https://download.docker.com/linux/ubuntu $(lsb_release -cs) stable" | tee /etc/apt/sources.list.d/docker.list > /dev/null
-
-# Install Docker Engine
-apt-get update
-apt-get install -y docker-ce docker-ce-cli containerd.io
-
-# Configure Docker to start on boot
-systemctl enable docker
-""")
-        
-        # Add user to docker group if needed
-        if self.add_user:
-            script_file.write("""
-# Add current user to docker group
-usermod -aG docker $SUDO_USER
-""")
-        
-        # Start Docker if needed
-        if self.auto_start:
-            script_file.write("""
-# Start Docker service
-systemctl start docker
-""")
-    
-    def _write_fedora_script(self, script_file):
-        """Write Fedora/CentOS/RHEL-specific installation script."""
-        script_file.write("""
-# Remove old versions if any
-dnf remove -y docker docker-client docker-client-latest docker-common docker-latest docker-latest-logrotate docker-logrotate docker-engine podman 2>/dev/null || true
-
-# Install required packages
-dnf -y install dnf-plugins-core
-
-# Add Docker repo
-dnf config-manager --add-repo https://download.docker.com/linux/fedora/docker-ce.repo
-
-# Install Docker
-dnf install -y docker-ce docker-ce-cli containerd.io
-
-# Configure Docker to start on boot
-systemctl enable docker
-""")
-        
-        # Add user to docker group if needed
-        if self.add_user:
-            script_file.write("""
-# Add current user to docker group
-usermod -aG docker $SUDO_USER
-""")
-        
-        # Start Docker if needed
-        if self.auto_start:
-            script_file.write("""
-# Start Docker service
-systemctl start docker
-""")
-    
-    def _write_generic_script(self, script_file):
-        """Write generic Linux installation script."""
-        script_file.write("""
-# Using convenience script for other distributions
-curl -fsSL https://get.docker.com -o get-docker.sh
-sh get-docker.sh
+            try:
+                # Run uninstallation script with sudo
+                with subprocess.Popen(
+                    ["sudo", uninstall_script],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    bufsize=1
+                ) as process:
+                    for line in process.stdout:
+                        self.worker.log_message.emit(line.strip())
+                    process.wait()
+            except Exception as e:
+                self.worker.log_message.emit(f"Warning: Error during Docker uninstallation: {str(e)}")
 
-# Configure Docker to start on boot
-systemctl enable docker 2>/dev/null || true
-""")
-        
-        # Add user to docker group if needed
-        if self.add_user:
-            script_file.write("""
-# Add current user to docker group
-usermod -aG docker $SUDO_USER 2>/dev/null || usermod -aG docker $USER
-""")
-        
-        # Start Docker if needed
-        if self.auto_start:
-            script_file.write("""
-# Start Docker service
-systemctl start docker 2>/dev/null || service docker start
-""")
+    def _build_script(self):
+        """Render the installation script for the detected distribution."""
+        family = _DISTRO_FAMILIES.get(self.distro, "_default")
+        return _DISTRO_SCRIPTS[family].format(
+            add_user=_ADD_USER_SNIPPETS[family] if self.add_user else "",
+            auto_start=_AUTO_START_SNIPPETS[family] if self.auto_start else ""
+        )
 
 class DockerVerificationStep(InstallationStep):
     """Verifies Docker installation on Linux."""
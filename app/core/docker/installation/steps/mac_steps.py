@@ -1,6 +1,11 @@
+import os
+import platform
 import subprocess
 from .base import InstallationStep
 
+# Docker Desktop publishes one DMG per CPU architecture
+_DESKTOP_DMG_ARCH = {"x86_64": "amd64", "amd64": "amd64", "arm64": "arm64", "aarch64": "arm64"}
+
 class HomebrewInstallStep(InstallationStep):
     """Installs Homebrew on macOS."""
     def __init__(self, worker):
@@ -14,10 +19,12 @@ class HomebrewInstallStep(InstallationStep):
                 self.worker.log_message.emit("Homebrew is already installed")
                 return
             self.worker.log_message.emit("Installing Homebrew...")
-            subprocess.run(
-                '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"',
-                shell=True, check=True
-            )
+            command = '/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"'
+            # Own session so cancelling can stop the installer, not just the outer shell
+            process = subprocess.Popen(command, shell=True, start_new_session=True)
+            returncode = self.wait_for_process(process, kill_group=True)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command)
             self.homebrew_installed = True
         except Exception as e:
             self.worker.log_message.emit(f"Error installing Homebrew: {str(e)}")
@@ -50,6 +57,52 @@ class ColimaInstallStep(InstallationStep):
         self.worker.log_message.emit("Rolling back Colima installation...")
         subprocess.run(["brew", "uninstall", "colima"], check=False)
 
+class BrewFormulaeInstallStep(InstallationStep):
+    """Installs several Homebrew formulae with a single brew invocation."""
+    def __init__(self, worker, formulae=("docker", "colima"), progress_range=(30, 50)):
+        super().__init__("Installing " + ", ".join(formulae), worker)
+        self.formulae = list(formulae)
+        self.progress_range = progress_range
+        self.formulae_installed = False
+
+    def execute(self):
+        """Install all formulae with one brew install, reporting progress per stage."""
+        self.worker.log_message.emit(f"Installing {', '.join(self.formulae)} via Homebrew...")
+        start, end = self.progress_range
+        progress = start
+        self.worker.progress_updated.emit(progress, "Installing Homebrew packages...")
+        with subprocess.Popen(
+            ["brew", "install", *self.formulae],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as process:
+            for line in process.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                self.worker.log_message.emit(line)
+                # Homebrew prefixes each download/pour stage with "==>"
+                if line.startswith("==>") and progress < end:
+                    progress += 1
+                    self.worker.progress_updated.emit(progress, line[3:].strip())
+                if self.worker.cancelled:
+                    process.terminate()
+                    raise Exception("Installation cancelled by user")
+            process.wait()
+            if process.returncode != 0:
+                raise Exception(f"brew install failed with code {process.returncode}")
+        self.formulae_installed = True
+        self.worker.progress_updated.emit(end, "Homebrew packages installed")
+
+    def rollback(self):
+        """Uninstall the formulae together (docker and colima by default), as they were installed as one step."""
+        if not self.formulae_installed:
+            return
+        self.worker.log_message.emit(f"Rolling back {', '.join(self.formulae)} installation...")
+        subprocess.run(["brew", "uninstall", *self.formulae], check=False)
+
 class ColimaStartStep(InstallationStep):
     """Starts Colima and configures auto-start."""
     def execute(self):
@@ -69,10 +122,14 @@ class DesktopDownloadStep(InstallationStep):
         self.dmg_path = None
 
     def execute(self):
+        machine = platform.machine().lower()
+        arch = _DESKTOP_DMG_ARCH.get(machine)
+        if arch is None:
+            raise Exception(f"Unsupported CPU architecture for Docker Desktop: {machine}")
         self.dmg_path = "/tmp/Docker.dmg"
-        self.worker.log_message.emit("Downloading Docker Desktop DMG...")
+        self.worker.log_message.emit(f"Downloading Docker Desktop DMG ({arch})...")
         subprocess.run(
-            ["curl", "-L", "-o", self.dmg_path, "https://desktop.docker.com/mac/main/amd64/Docker.dmg"],
+            ["curl", "-L", "-o", self.dmg_path, f"https://desktop.docker.com/mac/main/{arch}/Docker.dmg"],
             check=True
         )
 
@@ -1,6 +1,35 @@
+import os
 import subprocess
+import tempfile
+import threading
 from .base import InstallationStep, DockerStep
 
+# Suppress console windows for child processes (0 on non-Windows platforms)
+_NOWIN = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# All WSL2 setup commands run in one PowerShell process instead of one spawn each
+_ENABLE_WSL2_SCRIPT = """$ProgressPreference = 'SilentlyContinue'
+$ErrorActionPreference = 'Stop'
+
+Write-Output 'Enabling Windows Subsystem for Linux...'
+dism.exe /online /enable-feature /featurename:Microsoft-Windows-Subsystem-Linux /all /norestart
+if ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }
+
+Write-Output 'Enabling Virtual Machine Platform...'
+dism.exe /online /enable-feature /featurename:VirtualMachinePlatform /all /norestart
+if ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }
+
+Write-Output 'Setting WSL default version to 2...'
+wsl.exe --set-default-version 2
+if ($LASTEXITCODE -ne 0) { exit $LASTEXITCODE }
+"""
+
+_DISABLE_WSL2_SCRIPT = """$ProgressPreference = 'SilentlyContinue'
+
+dism.exe /online /disable-feature /featurename:Microsoft-Windows-Subsystem-Linux /norestart
+dism.exe /online /disable-feature /featurename:VirtualMachinePlatform /norestart
+"""
+
 class WindowsWSL2Step(InstallationStep):
     """Installs and configures WSL2 on Windows."""
     def __init__(self, worker):
@@ -11,29 +40,17 @@ class WindowsWSL2Step(InstallationStep):
         """Enable and configure WSL2."""
         try:
             result = subprocess.run(
-                ["wsl", "--status"], 
-                capture_output=True, 
-                text=True
+                ["wsl.exe", "--status"],
+                capture_output=True,
+                text=True,
+                creationflags=_NOWIN,
+                timeout=10
             )
             self.wsl_was_installed = "WSL 2" in result.stdout or "WSL 2" in result.stderr
             
             if not self.wsl_was_installed:
                 self.worker.log_message.emit("Enabling WSL2...")
-                subprocess.run(
-                    ["dism.exe", "/online", "/enable-feature", "/featurename:Microsoft-Windows-Subsystem-Linux", "/all", "/norestart"],
-                    check=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                subprocess.run(
-                    ["dism.exe", "/online", "/enable-feature", "/featurename:VirtualMachinePlatform", "/all", "/norestart"],
-                    check=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
-                subprocess.run(
-                    ["wsl", "--set-default-version", "2"],
-                    check=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW
-                )
+                self._run_powershell_script(_ENABLE_WSL2_SCRIPT)
         except subprocess.CalledProcessError as e:
             if e.returncode == 740:
                 self.worker.log_message.emit("Error: Administrator privileges are required to enable WSL2.")
@@ -44,6 +61,38 @@ class WindowsWSL2Step(InstallationStep):
             self.worker.log_message.emit(f"Unexpected error during WSL2 setup: {str(e)}")
             raise
 
+    def _run_powershell_script(self, script):
+        """Run a PowerShell script in a single process, streaming its output to the log."""
+        with tempfile.TemporaryDirectory(prefix="docker_install_") as temp_dir:
+            script_path = os.path.join(temp_dir, "wsl2_setup.ps1")
+            with open(script_path, "w", encoding="utf-8") as script_file:
+                script_file.write(script)
+            
+            command = ["powershell.exe", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", script_path]
+            with subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                creationflags=_NOWIN
+            ) as process:
+                # Output is forwarded from a helper thread so cancellation is still
+                # polled while dism runs silently
+                reader = threading.Thread(target=self._log_output, args=(process.stdout,), daemon=True)
+                reader.start()
+                returncode = self.wait_for_process(process)
+                reader.join()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, command)
+
+    def _log_output(self, stream):
+        """Forward each non-empty output line to the installation log."""
+        for line in stream:
+            line = line.strip()
+            if line:
+                self.worker.log_message.emit(line)
+
     def rollback(self):
         """Roll back WSL2 changes if we installed it."""
         if not self.wsl_was_installed:
@@ -51,14 +100,7 @@ class WindowsWSL2Step(InstallationStep):
             return
         self.worker.log_message.emit("Rolling back WSL2 configuration...")
         try:
-            subprocess.run(
-                ["dism.exe", "/online", "/disable-feature", "/featurename:Microsoft-Windows-Subsystem-Linux", "/norestart"],
-                check=False
-            )
-            subprocess.run(
-                ["dism.exe", "/online", "/disable-feature", "/featurename:VirtualMachinePlatform", "/norestart"],
-                check=False
-            )
+            self._run_powershell_script(_DISABLE_WSL2_SCRIPT)
         except Exception as e:
             self.worker.log_message.emit(f"Warning: Failed to roll back WSL2: {str(e)}")
 
@@ -73,7 +115,12 @@ class WindowsDockerEngineStep(DockerStep):
         try:
             self.worker.log_message.emit("Installing Docker Engine...")
             # Example: Run Docker installer
-            subprocess.run(["docker-installer.exe", "/quiet"], check=True)
+            subprocess.run(
+                ["docker-installer.exe", "/quiet"],
+                check=True,
+                creationflags=_NOWIN,
+                timeout=1800
+            )
             self.service_registered = True
         except Exception as e:
             self.worker.log_message.emit(f"Error during Docker Engine installation: {str(e)}")
@@ -84,6 +131,11 @@ class WindowsDockerEngineStep(DockerStep):
         if self.service_registered:
             try:
                 self.worker.log_message.emit("Rolling back Docker Engine installation...")
-                subprocess.run(["sc", "delete", "docker"], check=False)
+                subprocess.run(
+                    ["sc.exe", "delete", "docker"],
+                    check=False,
+                    creationflags=_NOWIN,
+                    timeout=30
+                )
             except Exception as e:
                 self.worker.log_message.emit(f"Warning: Failed to roll back Docker Engine: {str(e)}")
@@ -16,6 +16,8 @@ class DockerUnavailableWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.status_checker = DockerStatusChecker()
+        self._install_dialog = None  # Built on first use and reused afterwards
+        self._setup_dialog = None
         self.init_ui()
     
     def init_ui(self):
@@ -126,15 +128,21 @@ class DockerUnavailableWidget(QWidget):
     
     def show_setup_assistant(self):
         """Show the Docker setup assistant dialog."""
-        dialog = DockerSetupDialog(self)
-        dialog.docker_check_requested.connect(self.retry_requested.emit)
-        dialog.exec_()
+        if self._setup_dialog is None:
+            self._setup_dialog = DockerSetupDialog(self)
+            self._setup_dialog.docker_check_requested.connect(self.retry_requested.emit)
+        else:
+            self._setup_dialog.check_docker_status()
+        self._setup_dialog.exec_()
     
     def show_install_dialog(self):
         """Show the Docker installation dialog that combines auto and quick install options."""
-        dialog = DockerQuickInstallDialog(self)
-        dialog.install_requested.connect(self.start_installation)
-        dialog.exec_()
+        if self._install_dialog is None:
+            self._install_dialog = DockerQuickInstallDialog(self)
+            self._install_dialog.install_requested.connect(self.start_installation)
+        else:
+            self._install_dialog.reset()
+        self._install_dialog.exec_()
 
     def start_installation(self, config):
         """Start the Docker installation with the provided configuration."""
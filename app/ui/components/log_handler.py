@@ -1,6 +1,22 @@
 import logging
 from PyQt5.QtCore import QObject, pyqtSignal
 
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that reuses the timestamp string for records in the same second."""
+    
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._last_second = None
+        self._last_stamp = ""
+    
+    def formatTime(self, record, datefmt=None):
+        """Format the record time, only calling strftime when the second changes."""
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_stamp = super().formatTime(record, datefmt)
+            self._last_second = second
+        return self._last_stamp
+
 class QtLogHandler(logging.Handler, QObject):
     """
     Custom logging handler that emits Qt signals for log messages.
@@ -12,7 +28,7 @@ class QtLogHandler(logging.Handler, QObject):
         QObject.__init__(self)
         logging.Handler.__init__(self, level)
         # Use same format as the main logger for consistency
-        self.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', '%H:%M:%S'))
+        self.setFormatter(_SecondCachedFormatter('%(asctime)s - %(levelname)s - %(message)s', '%H:%M:%S'))
         self.registered = True
         
     def emit(self, record):
@@ -23,11 +23,16 @@ class LogWidget(QTextEdit):
     
     def append(self, text: str):
         """Append text to the log with automatic scrolling and line limiting."""
+        # Only follow new output if the user hasn't scrolled up to read earlier lines
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 4
+        
         # Add text to the log
         super().append(text)
         
         # Auto-scroll to bottom
-        self.moveCursor(QTextCursor.End)
+        if at_bottom:
+            bar.setValue(bar.maximum())
         
         # Limit number of lines in the log
         if self.document().lineCount() > self.max_lines:
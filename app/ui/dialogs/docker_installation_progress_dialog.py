@@ -1,28 +1,29 @@
 import os
 import platform
-import subprocess
-import tempfile
 import time
 import shutil
-import requests
 import sys
-from pathlib import Path
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, 
-                           QProgressBar, QTextEdit, QHBoxLayout, QScrollArea, QWidget, QFrame, QGroupBox)
+                           QProgressBar, QPlainTextEdit, QHBoxLayout)
 from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt5.QtGui import QFont
 from app.core.docker.installation.step_manager import InstallationStepManager
-from app.core.docker.installation.steps.windows_steps import WindowsWSL2Step, WindowsDockerEngineStep
-from app.core.docker.installation.steps.mac_steps import HomebrewInstallStep, DockerCLIInstallStep, ColimaInstallStep, ColimaStartStep, DesktopDownloadStep, DesktopInstallStep
-from app.core.docker.installation.steps.linux_steps import DetectDistroStep, DockerPackageStep, DockerVerificationStep
 from app.core.docker.common.state_verifier import InstallationStateVerifier
 
+_REQUIRED_FREE_BYTES = 2 << 30  # 2 GiB
+
+# Where Docker ends up on each platform; Windows uses %ProgramFiles%
+_INSTALL_TARGETS = {"linux": "/var/lib/docker", "darwin": "/Applications"}
+
 class InstallationWorker(QThread):
     """Worker thread for Docker installation."""
     progress_updated = pyqtSignal(int, str)
     log_message = pyqtSignal(str)
     installation_completed = pyqtSignal(bool, str)
     
+    # Maps platform.system().lower() to the installer method for that platform
+    _INSTALLERS = {"windows": "install_on_windows", "darwin": "install_on_mac", "linux": "install_on_linux"}
+    
     def __init__(self, config):
         super().__init__()
         self.config = config
@@ -45,14 +46,11 @@ class InstallationWorker(QThread):
             self.log_message.emit(f"Installation mode: {'Automatic' if auto_mode else 'Custom'}")
             
             # Platform-specific installation
-            if self.current_platform == "windows":
-                success, message = self.install_on_windows()
-            elif self.current_platform == "darwin":  # macOS
-                success, message = self.install_on_mac()
-            elif self.current_platform == "linux":
-                success, message = self.install_on_linux()
-            else:
+            method = self._INSTALLERS.get(self.current_platform)
+            if method is None:
                 success, message = False, f"Unsupported platform: {self.current_platform}"
+            else:
+                success, message = getattr(self, method)()
                 
             self.installation_completed.emit(success, message)
         except Exception as e:
@@ -64,7 +62,7 @@ class InstallationWorker(QThread):
         self.log_message.emit("Performing pre-flight checks...")
         try:
             # Example: Check if sufficient disk space is available
-            if shutil.disk_usage("/").free < 2 * 1024 * 1024 * 1024:  # 2GB
+            if self._free_install_space() < _REQUIRED_FREE_BYTES:
                 self.log_message.emit("ERROR: Not enough disk space available")
                 return False
             
@@ -81,8 +79,21 @@ class InstallationWorker(QThread):
             self.log_message.emit(f"ERROR during pre-flight checks: {str(e)}")
             return False
     
+    def _free_install_space(self):
+        """Return the free bytes on the filesystem Docker will be installed to."""
+        target = _INSTALL_TARGETS.get(self.current_platform) or os.environ.get("ProgramFiles", "C:\\")
+        # Walk up to the nearest existing directory (e.g. before /var/lib/docker exists)
+        while not os.path.isdir(target) and os.path.dirname(target) != target:
+            target = os.path.dirname(target)
+        if hasattr(os, "statvfs"):
+            stats = os.statvfs(target)
+            return stats.f_bavail * stats.f_frsize
+        return shutil.disk_usage(target).free
+    
     def install_on_windows(self):
         """Install Docker on Windows using step-based architecture."""
+        # Platform steps are imported on demand so other platforms never load them
+        from app.core.docker.installation.steps.windows_steps import WindowsWSL2Step, WindowsDockerEngineStep
         self.progress_updated.emit(5, "Preparing Windows environment...")
         temp_resources = []  # Track resources to clean up
         
@@ -106,17 +117,13 @@ class InstallationWorker(QThread):
         finally:
             # Clean up all registered resources
             for resource in temp_resources:
-                if os.path.exists(resource):
-                    try:
-                        shutil.rmtree(resource) if os.path.isdir(resource) else os.remove(resource)
-                        self.log_message.emit(f"Cleaned up temporary resource: {resource}")
-                    except Exception as e:
-                        self.log_message.emit(f"Warning: Failed to clean up {resource}: {str(e)}")
+                self._cleanup(resource)
             if self.step_manager:
                 self.step_manager.verify_system_state()
     
     def install_on_mac(self):
         """Install Docker on macOS using step-based architecture."""
+        from app.core.docker.installation.steps.mac_steps import HomebrewInstallStep, BrewFormulaeInstallStep
         self.progress_updated.emit(5, "Preparing macOS environment...")
         temp_resources = []  # Track resources to clean up
         
@@ -125,8 +132,7 @@ class InstallationWorker(QThread):
             
             # Add steps
             self.step_manager.add_step(HomebrewInstallStep(self))
-            self.step_manager.add_step(DockerCLIInstallStep(self))
-            self.step_manager.add_step(ColimaInstallStep(self))
+            self.step_manager.add_step(BrewFormulaeInstallStep(self, ("docker", "colima")))
             
             # Execute all steps with rollback and cleanup
             success, message = self.step_manager.execute_steps()
@@ -142,17 +148,13 @@ class InstallationWorker(QThread):
         finally:
             # Clean up all registered resources
             for resource in temp_resources:
-                if os.path.exists(resource):
-                    try:
-                        shutil.rmtree(resource) if os.path.isdir(resource) else os.remove(resource)
-                        self.log_message.emit(f"Cleaned up temporary resource: {resource}")
-                    except Exception as e:
-                        self.log_message.emit(f"Warning: Failed to clean up {resource}: {str(e)}")
+                self._cleanup(resource)
             if self.step_manager:
                 self.step_manager.verify_system_state()
     
     def install_on_linux(self):
         """Install Docker on Linux using step-based architecture."""
+        from app.core.docker.installation.steps.linux_steps import DetectDistroStep, DockerPackageStep, DockerVerificationStep
         self.progress_updated.emit(5, "Preparing Linux environment...")
         temp_resources = []  # Track resources to clean up
         
@@ -169,10 +171,6 @@ class InstallationWorker(QThread):
             self.step_manager.add_step(DockerPackageStep(self, detect_distro_step.distro, add_user, auto_start))
             self.step_manager.add_step(DockerVerificationStep(self, add_user))
             
-            # Register temporary resources
-            temp_script = tempfile.NamedTemporaryFile(delete=False, suffix=".sh").name
-            temp_resources.append(temp_script)
-            
             # Verify prerequisites for each step
             for step in self.step_manager.steps:
                 InstallationStateVerifier.verify_step_prerequisites(step, self)
@@ -191,17 +189,26 @@ class InstallationWorker(QThread):
         finally:
             # Clean up all registered resources
             for resource in temp_resources:
-                if os.path.exists(resource):
-                    try:
-                        shutil.rmtree(resource) if os.path.isdir(resource) else os.remove(resource)
-                        self.log_message.emit(f"Cleaned up temporary resource: {resource}")
-                    except Exception as e:
-                        self.log_message.emit(f"Warning: Failed to clean up {resource}: {str(e)}")
+                self._cleanup(resource)
             if self.step_manager:
                 self.step_manager.verify_system_state()
     
+    def _cleanup(self, resource):
+        """Remove a temporary file or directory, ignoring ones already gone."""
+        try:
+            try:
+                shutil.rmtree(resource)
+            except NotADirectoryError:
+                os.unlink(resource)
+            self.log_message.emit(f"Cleaned up temporary resource: {resource}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.log_message.emit(f"Warning: Failed to clean up {resource}: {str(e)}")
+    
     def download_file(self, url, destination):
         """Download a file from a URL to a destination with progress updates."""
+        import requests
         self.log_message.emit(f"Downloading {url} to {destination}")
         
         try:
@@ -237,30 +244,15 @@ class InstallationWorker(QThread):
     
     def get_linux_distro(self):
         """Detect the Linux distribution."""
-        try:
-            if os.path.exists("/etc/os-release"):
-                with open("/etc/os-release") as f:
-                    for line in f:
-                        if line.startswith("ID="):
-                            return line.split("=")[1].strip().strip('"')
-            
-            # Fallbacks
-            if os.path.exists("/etc/debian_version"):
-                return "debian"
-            elif os.path.exists("/etc/fedora-release"):
-                return "fedora"
-            elif os.path.exists("/etc/centos-release"):
-                return "centos"
-            elif os.path.exists("/etc/redhat-release"):
-                return "rhel"
-                
-            return "unknown"
-        except:
+        if not sys.platform.startswith("linux"):
             return "unknown"
+        from app.core.docker.installation.steps.linux_steps import DetectDistroStep
+        return DetectDistroStep.detect_distro()
 
     def cancel(self):
         """Cancel the installation process and trigger rollback."""
         self.cancelled = True
+        self.requestInterruption()
         self.log_message.emit("Installation cancelled by user.")
         if self.step_manager:
             self.step_manager.rollback_steps()
@@ -272,6 +264,7 @@ class DockerInstallationProgressDialog(QDialog):
     
     def __init__(self, config, parent=None):
         super().__init__(parent)
+        self.worker = None
         self.config = config
         self.setWindowTitle("Installing Docker")
         self.setMinimumSize(600, 400)
@@ -305,11 +298,19 @@ class DockerInstallationProgressDialog(QDialog):
         log_label = QLabel("Installation Log:")
         layout.addWidget(log_label)
         
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(2000)  # Keep memory bounded on long installs
         self.log_display.setMinimumHeight(200)
         layout.addWidget(self.log_display)
         
+        # Log lines are buffered and written in batches to avoid a relayout per line
+        self._pending_logs = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self.flush_log_messages)
+        
         # Buttons
         button_layout = QHBoxLayout()
         self.cancel_button = QPushButton("Cancel")
@@ -366,12 +367,19 @@ class DockerInstallationProgressDialog(QDialog):
         self.status_label.setText(message)
     
     def add_log_message(self, message):
-        """Add a message to the log display."""
-        self.log_display.append(message)
-        # Auto-scroll to bottom
-        self.log_display.verticalScrollBar().setValue(
-            self.log_display.verticalScrollBar().maximum()
-        )
+        """Queue a message for the log display."""
+        self._pending_logs.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def flush_log_messages(self):
+        """Write all queued messages to the log display in one edit."""
+        if not self._pending_logs:
+            return
+        text = "\n".join(self._pending_logs)
+        self._pending_logs.clear()
+        # appendPlainText keeps following the end only when already scrolled there
+        self.log_display.appendPlainText(text)
     
     def on_installation_completed(self, success, message):
         """Handle installation completion."""
@@ -382,6 +390,7 @@ class DockerInstallationProgressDialog(QDialog):
         else:
             self.status_label.setText("Installation failed")
             self.add_log_message(f"ERROR: {message}")
+        self.flush_log_messages()
         
         self.cancel_button.setEnabled(False)
         self.close_button.setEnabled(True)
@@ -389,7 +398,7 @@ class DockerInstallationProgressDialog(QDialog):
     
     def cancel_installation(self):
         """Cancel the installation process."""
-        if hasattr(self, 'worker') and self.worker.isRunning():
+        if self.worker is not None and self.worker.isRunning():
             self.worker.cancel()
             self.cancel_button.setEnabled(False)
             self.status_label.setText("Cancelling installation...")
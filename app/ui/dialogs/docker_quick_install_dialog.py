@@ -1,23 +1,301 @@
+import functools
 import platform
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, 
                              QHBoxLayout, QComboBox, QFormLayout, QCheckBox,
                              QTabWidget, QWidget, QRadioButton, QButtonGroup,
-                             QSpacerItem, QSizePolicy, QMessageBox, QGroupBox,
-                             QTextBrowser)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QAbstractButton, QMessageBox, QGroupBox, QScrollArea)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QFont
 from app.core.utils.admin_utils import is_admin, request_admin_privileges
 
+_CURRENT_SYSTEM = platform.system().lower()
+
+@functools.lru_cache(maxsize=1)
+def _cached_is_admin():
+    """Check admin rights once; privileges only change through a restart."""
+    return is_admin()
+
+@functools.lru_cache(maxsize=1)
+def _title_font():
+    """Build the dialog title font on first use; QFont needs a QApplication."""
+    font = QFont()
+    font.setPointSize(14)
+    font.setBold(True)
+    return font
+
+_ADMIN_REQUIRED_MSG = ("Docker installation requires administrator privileges. "
+                       "The application will now restart with elevated permissions.")
+_CONFIRM_AUTO_MSG = "Docker will be installed with recommended settings for your platform."
+_CONFIRM_CUSTOM_MSG = "Docker will be installed with your custom settings."
+
+_NO_STEPS_HTML = "<p>No installation steps available for this platform.</p>"
+
+# Automatic-mode steps per platform; they don't depend on any option
+_AUTO_STEPS = {
+    "windows": """
+            <h3>Automatic Windows Installation Steps:</h3>
+            <ol>
+                <li>Check system prerequisites (WSL2, Windows version)</li>
+                <li>Download Docker installer</li>
+                <li>Install Docker Engine with recommended settings</li>
+                <li>Configure Docker to start automatically</li>
+                <li>Add current user to docker group (if applicable)</li>
+                <li>Verify installation</li>
+            </ol>
+            """,
+    "darwin": """
+            <h3>Automatic macOS Installation Steps:</h3>
+            <ol>
+                <li>Check system prerequisites</li>
+                <li>Install Homebrew (if not installed)</li>
+                <li>Install Docker CLI via Homebrew</li>
+                <li>Install and configure Colima as Docker backend</li>
+                <li>Set up automatic startup</li>
+                <li>Verify installation</li>
+            </ol>
+            """,
+    "linux": """
+            <h3>Automatic Linux Installation Steps:</h3>
+            <ol>
+                <li>Detect Linux distribution</li>
+                <li>Add Docker repository</li>
+                <li>Install Docker Engine packages</li>
+                <li>Add current user to docker group</li>
+                <li>Configure Docker to start on boot</li>
+                <li>Start Docker service</li>
+                <li>Verify installation</li>
+            </ol>
+            """,
+}
+
+# Custom-mode step fragments, joined by the *_steps builders below
+_WIN_FRAGMENTS = {
+    "header": "<h3>Windows Installation Steps:</h3>",
+    "license_warn": """<div style="color: red; border: 1px solid red; padding: 8px; margin-bottom: 10px;">
+            <strong>Warning:</strong> Docker license must be accepted to proceed with installation.
+            </div>""",
+    "prereq": "<ol><li>Check system prerequisites (Windows version, hardware requirements)</li>",
+    "wsl2": """<li>Enable Windows Subsystem for Linux:
+                <ul>
+                    <li>Enable WSL2 Windows feature</li>
+                    <li>Install WSL2 kernel update if needed</li>
+                    <li>Set WSL2 as default WSL version</li>
+                </ul>
+            </li>""",
+    "engine": """<li>Install Docker Engine:
+                <ul>
+                    <li>Download Docker Engine installer</li>
+                    <li>Install Docker Engine binaries</li>
+                    <li>Configure Docker Engine settings</li>
+                </ul>
+            </li>""",
+    "wsl2_install": """<li>Install Docker Engine with WSL2 backend:
+                <ul>
+                    <li>Download Docker Engine installer</li>
+                    <li>Configure WSL2 integration</li>
+                    <li>Install Docker Engine binaries</li>
+                    <li>Set up WSL2 backend configuration</li>
+                </ul>
+            </li>""",
+    "cli": """<li>Install Docker Engine and CLI:
+                <ul>
+                    <li>Download Docker Engine and CLI installer</li>
+                    <li>Install Docker binaries</li>
+                    <li>Add Docker CLI to PATH</li>
+                </ul>
+            </li>""",
+    "autostart_on": """<li>Configure Docker to start automatically:
+                <ul>
+                    <li>Create Windows service for Docker</li>
+                    <li>Set service to start automatically on boot</li>
+                    <li>Start Docker service now</li>
+                </ul>
+            </li>""",
+    "autostart_off": "<li>Configure Docker for manual start only</li>",
+    "verify": """<li>Verify installation:
+            <ul>
+                <li>Check Docker service status</li>
+                <li>Run test container to validate installation</li>
+            </ul>
+        </li></ol>""",
+}
+
+_MAC_FRAGMENTS = {
+    "header": """<h3>macOS Installation Steps:</h3><ol>
+            <li>Check system prerequisites (macOS version, architecture)</li>
+            <li>Install Homebrew package manager (if not already installed)</li>""",
+    "colima": """<li>Set up Docker with Colima:
+                <ul>
+                    <li>Install Docker CLI via Homebrew</li>
+                    <li>Install Colima virtual machine runtime</li>
+                    <li>Configure Colima for Docker compatibility</li>
+                    <li>Initialize Colima environment</li>
+                </ul>
+            </li>""",
+    "cli": """<li>Install Docker CLI only:
+                <ul>
+                    <li>Install Docker CLI via Homebrew</li>
+                    <li>Set up Docker context</li>
+                    <li>Configure Docker environment variables</li>
+                </ul>
+            </li>""",
+    "desktop": """<li>Install Docker Desktop:
+                <ul>
+                    <li>Download Docker Desktop for Mac (.dmg)</li>
+                    <li>Install Docker Desktop application</li>
+                    <li>Set up Docker Desktop preferences</li>
+                </ul>
+            </li>""",
+    "autostart_colima": """<li>Configure automatic startup:
+                    <ul>
+                        <li>Create LaunchAgent for Colima</li>
+                        <li>Register with macOS startup items</li>
+                        <li>Start Colima service now</li>
+                    </ul>
+                </li>""",
+    "autostart_desktop": """<li>Configure automatic startup:
+                    <ul>
+                        <li>Add Docker Desktop to Login Items</li>
+                        <li>Configure Docker Desktop to start on login</li>
+                        <li>Start Docker Desktop now</li>
+                    </ul>
+                </li>""",
+    "autostart_off": "<li>Skip automatic startup configuration</li>",
+    "verify": """<li>Verify installation:
+            <ul>
+                <li>Check Docker daemon status</li>
+                <li>Run test container to validate installation</li>
+            </ul>
+        </li></ol>""",
+}
+
+_LINUX_FRAGMENTS = {
+    "header": """<h3>Linux Installation Steps:</h3><ol>
+            <li>Detect Linux distribution and version</li>
+            <li>Set up Docker repository:
+            <ul>
+                <li>Install required dependencies</li>
+                <li>Add Docker's official GPG key</li>
+                <li>Add Docker repository to APT sources</li>
+                <li>Update package database</li>
+            </ul>
+        </li>
+        <li>Install Docker Engine:
+            <ul>
+                <li>Install Docker Engine, containerd, and Docker CLI</li>
+                <li>Install Docker Compose plugin</li>
+            </ul>
+        </li>""",
+    "add_user": """<li>Configure user permissions:
+                <ul>
+                    <li>Create docker group if it doesn't exist</li>
+                    <li>Add current user to docker group</li>
+                    <li>Apply group changes</li>
+                </ul>
+            </li>""",
+    "no_add_user": "<li>Skip user group configuration (Docker will require sudo)</li>",
+    "autostart_on": """<li>Configure Docker to start on boot:
+                <ul>
+                    <li>Enable Docker service with systemd</li>
+                    <li>Start Docker service now</li>
+                </ul>
+            </li>""",
+    "autostart_off": "<li>Skip automatic startup configuration</li>",
+    "verify": """<li>Verify installation:
+            <ul>
+                <li>Check Docker daemon status</li>
+                <li>Run test container to validate installation</li>
+                <li>Verify user permissions</li>
+            </ul>
+        </li></ol>""",
+}
+
+# Windows install type -> fragment key
+_WIN_INSTALL_KEYS = {"engine": "engine", "wsl2": "wsl2_install", "cli": "cli"}
+
+@functools.lru_cache(maxsize=32)
+def _windows_steps(install_data, use_wsl2, autostart, accept_license):
+    """Build the Windows custom-mode steps HTML."""
+    parts = [_WIN_FRAGMENTS["header"]]
+    if not accept_license:
+        parts.append(_WIN_FRAGMENTS["license_warn"])
+    parts.append(_WIN_FRAGMENTS["prereq"])
+    if use_wsl2:
+        parts.append(_WIN_FRAGMENTS["wsl2"])
+    if install_data in _WIN_INSTALL_KEYS:
+        parts.append(_WIN_FRAGMENTS[_WIN_INSTALL_KEYS[install_data]])
+    parts.append(_WIN_FRAGMENTS["autostart_on" if autostart else "autostart_off"])
+    parts.append(_WIN_FRAGMENTS["verify"])
+    return "".join(parts)
+
+@functools.lru_cache(maxsize=32)
+def _mac_steps(install_data, autostart):
+    """Build the macOS custom-mode steps HTML."""
+    parts = [_MAC_FRAGMENTS["header"]]
+    if install_data in ("colima", "cli", "desktop"):
+        parts.append(_MAC_FRAGMENTS[install_data])
+    if not autostart:
+        parts.append(_MAC_FRAGMENTS["autostart_off"])
+    elif install_data in ("colima", "desktop"):
+        parts.append(_MAC_FRAGMENTS["autostart_" + install_data])
+    parts.append(_MAC_FRAGMENTS["verify"])
+    return "".join(parts)
+
+@functools.lru_cache(maxsize=32)
+def _linux_steps(add_user, autostart):
+    """Build the Linux custom-mode steps HTML."""
+    return "".join((
+        _LINUX_FRAGMENTS["header"],
+        _LINUX_FRAGMENTS["add_user" if add_user else "no_add_user"],
+        _LINUX_FRAGMENTS["autostart_on" if autostart else "autostart_off"],
+        _LINUX_FRAGMENTS["verify"],
+    ))
+
+def _compact(layout, margin=6, spacing=4):
+    """Give a layout fixed margins and spacing instead of style-derived ones."""
+    layout.setContentsMargins(margin, margin, margin, margin)
+    layout.setSpacing(spacing)
+    return layout
+
 class DockerQuickInstallDialog(QDialog):
     """Dialog for Docker installation configuration with auto and manual options."""
     
     install_requested = pyqtSignal(dict)
     
+    # Custom-mode checkboxes per platform: (label, attribute, default)
+    _WINDOWS_CHECKS = (
+        ("Use WSL2 backend (recommended for better performance)", "windows_use_wsl2", True),
+        ("Start Docker at system startup", "windows_autostart", True),
+        ("Accept Docker license agreement", "windows_accept_license", True),
+    )
+    _MAC_CHECKS = (
+        ("Start Docker at system startup", "mac_autostart", True),
+    )
+    _LINUX_CHECKS = (
+        ("Add current user to docker group", "linux_add_user", True),
+        ("Start Docker service at system startup", "linux_autostart", True),
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Docker Installation")
         self.setMinimumWidth(600)
-        self.current_system = platform.system().lower()
+        self.current_system = _CURRENT_SYSTEM
+        # Per-platform (tab factory, custom config collector, tab label, custom steps builder).
+        # Each builder takes the collector's values in order as positional arguments.
+        self._platform_handlers = {
+            "windows": (self.create_windows_tab, self._windows_config, "Windows", _windows_steps),
+            "darwin": (self.create_mac_tab, self._mac_config, "macOS", _mac_steps),
+            "linux": (self.create_linux_tab, self._linux_config, "Linux", _linux_steps),
+        }
+        self._platform_handler = self._platform_handlers.get(self.current_system)
+        # No custom widgets to read until the platform tab is built
+        self._collect_custom_config = dict
+        self._custom_steps_fn = self._platform_handler[3] if self._platform_handler else None
+        self._confirm_box = None  # Created on the first install request and reused
+        self._skip_confirm = False  # Set by automated callers to install without prompting
+        self._steps_dirty = True  # Set while collapsed so expanding rebuilds once
+        self._last_html = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -26,68 +304,50 @@ class DockerQuickInstallDialog(QDialog):
         
         # Title
         title = QLabel("Docker Installation")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_title_font())
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
         # Description
-        description = QLabel(
+        layout.addWidget(self._make_desc(
             "This utility will help you install Docker on your system. "
             "You can choose between automatic installation with recommended settings "
             "or customize the installation options."
-        )
-        description.setWordWrap(True)
-        layout.addWidget(description)
+        ))
         
         # Installation mode selection
         mode_group = QGroupBox("Installation Mode")
-        mode_layout = QVBoxLayout(mode_group)
+        mode_layout = _compact(QVBoxLayout(mode_group))
         
         self.auto_mode_radio = QRadioButton("Automatic Installation (Recommended)")
         self.auto_mode_radio.setChecked(True)
-        self.auto_mode_radio.toggled.connect(self.toggle_installation_mode)
         mode_layout.addWidget(self.auto_mode_radio)
         
-        auto_description = QLabel("Uses recommended settings for your platform with minimal configuration required.")
-        auto_description.setIndent(20)
-        auto_description.setWordWrap(True)
-        mode_layout.addWidget(auto_description)
+        mode_layout.addWidget(self._make_desc(
+            "Uses recommended settings for your platform with minimal configuration required.", indent=20))
         
         self.custom_mode_radio = QRadioButton("Custom Installation")
-        self.custom_mode_radio.toggled.connect(self.toggle_installation_mode)
+        
+        # One handler per mode switch instead of one per radio button toggle
+        self._mode_group = QButtonGroup(self)
+        self._mode_group.addButton(self.auto_mode_radio)
+        self._mode_group.addButton(self.custom_mode_radio)
+        self._mode_group.buttonToggled.connect(self._on_mode_changed)
         mode_layout.addWidget(self.custom_mode_radio)
         
-        custom_description = QLabel("Allows you to customize installation options for your platform.")
-        custom_description.setIndent(20)
-        custom_description.setWordWrap(True)
-        mode_layout.addWidget(custom_description)
+        mode_layout.addWidget(self._make_desc(
+            "Allows you to customize installation options for your platform.", indent=20))
         
         layout.addWidget(mode_group)
         
         # Create tabs for platform-specific options
         self.tab_widget = QTabWidget()
         
-        # Add platform-specific tabs
-        if self.current_system == "windows":
-            self.tab_widget.addTab(self.create_windows_tab(), "Windows")
-        elif self.current_system == "darwin":  # macOS
-            self.tab_widget.addTab(self.create_mac_tab(), "macOS")
-        elif self.current_system == "linux":
-            self.tab_widget.addTab(self.create_linux_tab(), "Linux")
-        else:
-            # Generic tab for unsupported platforms
-            unsupported_widget = QWidget()
-            unsupported_layout = QVBoxLayout(unsupported_widget)
-            unsupported_label = QLabel(
-                "Your platform is not directly supported for automatic installation. "
-                "Please visit the Docker documentation for manual installation instructions."
-            )
-            unsupported_label.setWordWrap(True)
-            unsupported_layout.addWidget(unsupported_label)
-            self.tab_widget.addTab(unsupported_widget, "Unsupported")
+        # Platform-specific options are built the first time Custom mode is selected
+        self._tab_built = False
+        placeholder = QLabel("Select Custom Installation to configure options.")
+        placeholder.setAlignment(Qt.AlignCenter)
+        self.tab_widget.addTab(placeholder, self._platform_handler[2] if self._platform_handler else "Unsupported")
         
         layout.addWidget(self.tab_widget)
         
@@ -97,16 +357,22 @@ class DockerQuickInstallDialog(QDialog):
         self.steps_group.setChecked(False)  # Start collapsed
         self.steps_group.toggled.connect(self.toggle_steps_visibility)
         
-        steps_layout = QVBoxLayout(self.steps_group)
-        self.steps_browser = QTextBrowser()
-        self.steps_browser.setMaximumHeight(0)  # Start with 0 height when collapsed
-        self.steps_browser.setMinimumHeight(0)
-        steps_layout.addWidget(self.steps_browser)
+        steps_layout = _compact(QVBoxLayout(self.steps_group))
+        # A rich-text label is enough for static steps; the scroll area handles overflow
+        self.steps_label = QLabel()
+        self.steps_label.setTextFormat(Qt.RichText)
+        self.steps_label.setWordWrap(True)
+        self.steps_label.setAlignment(Qt.AlignTop)
+        self.steps_scroll = QScrollArea()
+        self.steps_scroll.setWidgetResizable(True)
+        self.steps_scroll.setWidget(self.steps_label)
+        self.steps_scroll.setFixedHeight(0)  # Start with 0 height when collapsed
+        steps_layout.addWidget(self.steps_scroll)
         
         layout.addWidget(self.steps_group)
         
         # Add buttons
-        button_layout = QHBoxLayout()
+        button_layout = _compact(QHBoxLayout(), margin=0)
         
         button_layout.addStretch()
         
@@ -120,25 +386,76 @@ class DockerQuickInstallDialog(QDialog):
         
         layout.addLayout(button_layout)
         
+        # Coalesce bursts of option changes into one rebuild per event loop turn
+        self._steps_timer = QTimer(self)
+        self._steps_timer.setSingleShot(True)
+        self._steps_timer.setInterval(0)
+        self._steps_timer.timeout.connect(self._do_update_installation_steps)
+        
         # Update the installation steps text when tabs or options change
         self.tab_widget.currentChanged.connect(self.update_installation_steps)
-        self.auto_mode_radio.toggled.connect(self.update_installation_steps)
-        
-        # Initialize steps text
-        self.update_installation_steps()
+        # No initial steps build: _steps_dirty makes the first expand render them
         
         # Initialize UI state
         self.toggle_installation_mode()
     
-    def toggle_installation_mode(self):
+    def _make_desc(self, text, indent=0):
+        """Create a word-wrapped description label."""
+        label = QLabel(text)
+        label.setWordWrap(True)
+        if indent:
+            label.setIndent(indent)
+        return label
+    
+    @pyqtSlot(QAbstractButton, bool)
+    def _on_mode_changed(self, button, checked):
+        """Apply a mode switch once, when the newly selected radio button turns on."""
+        if checked:
+            self.toggle_installation_mode()
+            self.update_installation_steps()
+    
+    @pyqtSlot(bool)
+    def toggle_installation_mode(self, checked=False):
         """Toggle between automatic and custom installation mode."""
         is_auto = self.auto_mode_radio.isChecked()
-        self.tab_widget.setEnabled(not is_auto)
+        if not is_auto and not self._tab_built:
+            self._build_platform_tab()
+        # Enabling cascades through every child widget, so skip it when nothing changes
+        if self.tab_widget.isEnabled() == is_auto:
+            self.tab_widget.setEnabled(not is_auto)
+    
+    def _build_platform_tab(self):
+        """Replace the placeholder tab with the real options for this platform."""
+        if self._platform_handler:
+            create_tab, collect_config, label, _ = self._platform_handler
+            widget = create_tab()
+            self._collect_custom_config = collect_config
+        else:
+            # Generic tab for unsupported platforms
+            label = "Unsupported"
+            widget = QWidget()
+            unsupported_layout = _compact(QVBoxLayout(widget))
+            unsupported_layout.addWidget(self._make_desc(
+                "Your platform is not directly supported for automatic installation. "
+                "Please visit the Docker documentation for manual installation instructions."
+            ))
+        
+        self._tab_built = True
+        placeholder = self.tab_widget.widget(0)
+        # Swap silently; the mode change that triggered this refreshes the steps
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(0)
+        self.tab_widget.insertTab(0, widget, label)
+        self.tab_widget.setCurrentIndex(0)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
     
     def create_windows_tab(self):
         """Create Windows-specific installation options."""
         windows_widget = QWidget()
-        layout = QFormLayout(windows_widget)
+        layout = _compact(QVBoxLayout(windows_widget))
+        type_form = _compact(QFormLayout(), margin=0)
+        layout.addLayout(type_form)
         
         # Installation type - changed options to be clearer about Docker Engine
         self.windows_install_type = QComboBox()
@@ -146,32 +463,18 @@ class DockerQuickInstallDialog(QDialog):
         self.windows_install_type.addItem("Docker Engine with WSL2 backend", "wsl2")
         self.windows_install_type.addItem("Docker Engine + Docker CLI", "cli")
         self.windows_install_type.currentIndexChanged.connect(self.update_installation_steps)
-        layout.addRow("Installation Type:", self.windows_install_type)
-        
-        # WSL2 option - only relevant for some installation types
-        self.windows_use_wsl2 = QCheckBox("Use WSL2 backend (recommended for better performance)")
-        self.windows_use_wsl2.setChecked(True)
-        self.windows_use_wsl2.stateChanged.connect(self.update_installation_steps)
-        layout.addRow("", self.windows_use_wsl2)
-        
-        # Auto-start option
-        self.windows_autostart = QCheckBox("Start Docker at system startup")
-        self.windows_autostart.setChecked(True)
-        self.windows_autostart.stateChanged.connect(self.update_installation_steps)
-        layout.addRow("", self.windows_autostart)
-        
-        # License agreement
-        self.windows_accept_license = QCheckBox("Accept Docker license agreement")
-        self.windows_accept_license.setChecked(True)
-        self.windows_accept_license.stateChanged.connect(self.update_installation_steps)
-        layout.addRow("", self.windows_accept_license)
+        type_form.addRow("Installation Type:", self.windows_install_type)
+        
+        self._add_checks(layout, self._WINDOWS_CHECKS)
         
         return windows_widget
     
     def create_mac_tab(self):
         """Create macOS-specific installation options."""
         mac_widget = QWidget()
-        layout = QFormLayout(mac_widget)
+        layout = _compact(QVBoxLayout(mac_widget))
+        type_form = _compact(QFormLayout(), margin=0)
+        layout.addLayout(type_form)
         
         # Installation type - changed options to focus on Docker Engine
         self.mac_install_type = QComboBox()
@@ -179,383 +482,174 @@ class DockerQuickInstallDialog(QDialog):
         self.mac_install_type.addItem("Docker Engine CLI only", "cli")
         self.mac_install_type.addItem("Docker Engine + Docker Desktop GUI", "desktop")
         self.mac_install_type.currentIndexChanged.connect(self.update_installation_steps)
-        layout.addRow("Installation Type:", self.mac_install_type)
+        type_form.addRow("Installation Type:", self.mac_install_type)
         
-        # Auto-start option
-        self.mac_autostart = QCheckBox("Start Docker at system startup")
-        self.mac_autostart.setChecked(True)
-        self.mac_autostart.stateChanged.connect(self.update_installation_steps)
-        layout.addRow("", self.mac_autostart)
+        self._add_checks(layout, self._MAC_CHECKS)
         
         return mac_widget
     
     def create_linux_tab(self):
         """Create Linux-specific installation options."""
         linux_widget = QWidget()
-        layout = QFormLayout(linux_widget)
-        
-        # Add user to docker group
-        self.linux_add_user = QCheckBox("Add current user to docker group")
-        self.linux_add_user.setChecked(True)
-        self.linux_add_user.stateChanged.connect(self.update_installation_steps)
-        layout.addRow("", self.linux_add_user)
+        layout = _compact(QVBoxLayout(linux_widget))
         
-        # Auto-start option
-        self.linux_autostart = QCheckBox("Start Docker service at system startup")
-        self.linux_autostart.setChecked(True)
-        self.linux_autostart.stateChanged.connect(self.update_installation_steps)
-        layout.addRow("", self.linux_autostart)
+        self._add_checks(layout, self._LINUX_CHECKS)
         
         return linux_widget
     
+    def _add_checks(self, layout, checks):
+        """Add a checkbox row for each (label, attribute, default) entry."""
+        for label, attr, default in checks:
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(default)
+            checkbox.stateChanged.connect(self.update_installation_steps)
+            setattr(self, attr, checkbox)
+            layout.addWidget(checkbox)
+        layout.addStretch()
+    
+    def reset(self):
+        """Restore the default selections so a reused dialog opens like a new one."""
+        self.auto_mode_radio.setChecked(True)
+        self.steps_group.setChecked(False)
+        if self._tab_built:
+            for combo in ("windows_install_type", "mac_install_type"):
+                if hasattr(self, combo):
+                    getattr(self, combo).setCurrentIndex(0)
+            for _, attr, default in self._WINDOWS_CHECKS + self._MAC_CHECKS + self._LINUX_CHECKS:
+                if hasattr(self, attr):
+                    getattr(self, attr).setChecked(default)
+    
     def get_installation_config(self):
         """Get the installation configuration based on user selections."""
+        auto_mode = self.auto_mode_radio.isChecked()
         config = {
             "platform": self.current_system,
-            "auto_mode": self.auto_mode_radio.isChecked()
+            "auto_mode": auto_mode
         }
         
-        if not self.auto_mode_radio.isChecked():
+        if not auto_mode:
             # Only add custom options if in custom mode
-            if self.current_system == "windows":
-                config.update({
-                    "install_type": self.windows_install_type.currentData(),
-                    "use_wsl2": self.windows_use_wsl2.isChecked(),
-                    "autostart": self.windows_autostart.isChecked(),
-                    "accept_license": self.windows_accept_license.isChecked()
-                })
-            elif self.current_system == "darwin":  # macOS
-                config.update({
-                    "install_type": self.mac_install_type.currentData(),
-                    "autostart": self.mac_autostart.isChecked()
-                })
-            elif self.current_system == "linux":
-                config.update({
-                    "add_user": self.linux_add_user.isChecked(),
-                    "autostart": self.linux_autostart.isChecked()
-                })
+            config.update(self._collect_custom_config())
         
         return config
     
+    def _windows_config(self):
+        """Collect the custom Windows installation options."""
+        return {
+            "install_type": self.windows_install_type.currentData(),
+            "use_wsl2": self.windows_use_wsl2.isChecked(),
+            "autostart": self.windows_autostart.isChecked(),
+            "accept_license": self.windows_accept_license.isChecked()
+        }
+    
+    def _mac_config(self):
+        """Collect the custom macOS installation options."""
+        return {
+            "install_type": self.mac_install_type.currentData(),
+            "autostart": self.mac_autostart.isChecked()
+        }
+    
+    def _linux_config(self):
+        """Collect the custom Linux installation options."""
+        return {
+            "add_user": self.linux_add_user.isChecked(),
+            "autostart": self.linux_autostart.isChecked()
+        }
+    
+    @pyqtSlot()
     def request_installation(self):
         """Emit signal to request Docker installation with current configuration."""
         config = self.get_installation_config()
         
+        # Programmatic/automation use: no modal prompts
+        if self._skip_confirm:
+            self.install_requested.emit(config)
+            self.accept()
+            return
+        
+        
         # Check for admin privileges before proceeding with installation
-        if not is_admin():
-            msg_box = QMessageBox()
-            msg_box.setIcon(QMessageBox.Information)
-            msg_box.setText("Administrator privileges required")
-            msg_box.setInformativeText("Docker installation requires administrator privileges. " 
-                                      "The application will now restart with elevated permissions.")
-            msg_box.setStandardButtons(QMessageBox.Ok | QMessageBox.Cancel)
-            response = msg_box.exec_()
+        if not _cached_is_admin():
+            response = QMessageBox.information(
+                self, "Administrator privileges required", _ADMIN_REQUIRED_MSG,
+                QMessageBox.Ok | QMessageBox.Cancel
+            )
             
             if response == QMessageBox.Ok:
                 # Request admin privileges and restart
-                if not request_admin_privileges():
+                elevated = request_admin_privileges()
+                _cached_is_admin.cache_clear()
+                if not elevated:
                     return  # Program will restart with admin rights
             else:
                 return  # User cancelled
         
-        # Show different confirmation message based on mode
-        if self.auto_mode_radio.isChecked():
-            message = "Docker will be installed with recommended settings for your platform."
-        else:
-            message = "Docker will be installed with your custom settings."
-        
-        # Confirm installation
-        msg_box = QMessageBox()
-        msg_box.setIcon(QMessageBox.Question)
-        msg_box.setText("Are you sure you want to install Docker?")
-        msg_box.setInformativeText(message)
-        msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        msg_box.setDefaultButton(QMessageBox.No)
+        # Confirm installation, with a message depending on the mode
+        confirm_box = self._get_confirm_box()
+        confirm_box.setInformativeText(_CONFIRM_AUTO_MSG if config["auto_mode"] else _CONFIRM_CUSTOM_MSG)
         
-        response = msg_box.exec_()
+        response = confirm_box.exec_()
         if response == QMessageBox.Yes:
             self.install_requested.emit(config)
             self.accept()
     
+    def _get_confirm_box(self):
+        """Return the confirmation message box, creating it on first use."""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setWindowModality(Qt.WindowModal)
+            self._confirm_box.setIcon(QMessageBox.Question)
+            self._confirm_box.setText("Are you sure you want to install Docker?")
+            self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        # Make "No" the default again every time the box is reused
+        self._confirm_box.setDefaultButton(QMessageBox.No)
+        return self._confirm_box
+    
     def toggle_steps_visibility(self, checked):
         """Toggle the visibility of the installation steps."""
         if checked:
             # Expand
-            self.steps_browser.setMaximumHeight(200)
+            self.steps_scroll.setFixedHeight(200)
             self.steps_group.setTitle("Installation Steps (click to collapse)")
+            if self._steps_dirty:
+                self._do_update_installation_steps()
         else:
             # Collapse
-            self.steps_browser.setMaximumHeight(0)
+            self.steps_scroll.setFixedHeight(0)
             self.steps_group.setTitle("Installation Steps (click to expand)")
+            # Drop the laid-out text while hidden; expanding rebuilds it
+            self.steps_label.clear()
+            self._last_html = None
+            self._steps_dirty = True
 
     def update_installation_steps(self):
+        """Schedule an update of the displayed installation steps."""
+        self._steps_timer.start()
+
+    def _do_update_installation_steps(self):
         """Update the displayed installation steps based on current settings."""
-        if self.auto_mode_radio.isChecked():
-            # Auto mode steps
-            steps_html = self._get_auto_mode_steps()
-        else:
-            # Custom mode steps
-            current_index = self.tab_widget.currentIndex()
-            tab_text = self.tab_widget.tabText(current_index)
-            
-            if "Windows" in tab_text:
-                steps_html = self._get_windows_steps()
-            elif "macOS" in tab_text:
-                steps_html = self._get_mac_steps()
-            elif "Linux" in tab_text:
-                steps_html = self._get_linux_steps()
-            else:
-                steps_html = "<p>No installation steps available for this platform.</p>"
-        
-        self.steps_browser.setHtml(steps_html)
+        # Nothing is visible while collapsed; rebuild once the section is expanded
+        if not self.steps_group.isChecked():
+            self._steps_dirty = True
+            return
+        self._steps_dirty = False
+        
+        steps_html = self._build_steps()
+        # Skip relaying out the label when the text hasn't changed
+        if steps_html != self._last_html:
+            self._last_html = steps_html
+            self.steps_label.setText(steps_html)
+    
+    def _build_steps(self):
+        """Build the installation steps HTML for the current settings."""
+        if self.auto_mode_radio.isChecked() or not self._tab_built:
+            # Auto mode steps; custom widgets don't exist until the tab is built
+            return self._get_auto_mode_steps()
+        
+        # Custom mode steps: read the widgets once; the values are the builder's cache key
+        fn = self._custom_steps_fn
+        return fn(*self._collect_custom_config().values()) if fn else _NO_STEPS_HTML
 
     def _get_auto_mode_steps(self):
         """Get installation steps for automatic mode."""
-        if self.current_system == "windows":
-            return """
-            <h3>Automatic Windows Installation Steps:</h3>
-            <ol>
-                <li>Check system prerequisites (WSL2, Windows version)</li>
-                <li>Download Docker installer</li>
-                <li>Install Docker Engine with recommended settings</li>
-                <li>Configure Docker to start automatically</li>
-                <li>Add current user to docker group (if applicable)</li>
-                <li>Verify installation</li>
-            </ol>
-            """
-        elif self.current_system == "darwin":  # macOS
-            return """
-            <h3>Automatic macOS Installation Steps:</h3>
-            <ol>
-                <li>Check system prerequisites</li>
-                <li>Install Homebrew (if not installed)</li>
-                <li>Install Docker CLI via Homebrew</li>
-                <li>Install and configure Colima as Docker backend</li>
-                <li>Set up automatic startup</li>
-                <li>Verify installation</li>
-            </ol>
-            """
-        elif self.current_system == "linux":
-            return """
-            <h3>Automatic Linux Installation Steps:</h3>
-            <ol>
-                <li>Detect Linux distribution</li>
-                <li>Add Docker repository</li>
-                <li>Install Docker Engine packages</li>
-                <li>Add current user to docker group</li>
-                <li>Configure Docker to start on boot</li>
-                <li>Start Docker service</li>
-                <li>Verify installation</li>
-            </ol>
-            """
-        else:
-            return "<p>No installation steps available for this platform.</p>"
-
-    def _get_windows_steps(self):
-        """Get installation steps for Windows custom mode."""
-        install_type = self.windows_install_type.currentText()
-        install_data = self.windows_install_type.currentData()
-        use_wsl2 = self.windows_use_wsl2.isChecked()
-        auto_start = self.windows_autostart.isChecked()
-        accept_license = self.windows_accept_license.isChecked()
-        
-        # Start with header and common steps
-        steps = "<h3>Windows Installation Steps:</h3>"
-        
-        # Add warning if license not accepted
-        if not accept_license:
-            steps += """<div style="color: red; border: 1px solid red; padding: 8px; margin-bottom: 10px;">
-            <strong>Warning:</strong> Docker license must be accepted to proceed with installation.
-            </div>"""
-        
-        steps += "<ol>"
-        steps += "<li>Check system prerequisites (Windows version, hardware requirements)</li>"
-        
-        # WSL2-specific steps
-        if use_wsl2:
-            steps += """<li>Enable Windows Subsystem for Linux:
-                <ul>
-                    <li>Enable WSL2 Windows feature</li>
-                    <li>Install WSL2 kernel update if needed</li>
-                    <li>Set WSL2 as default WSL version</li>
-                </ul>
-            </li>"""
-        
-        # Installation type specific steps
-        if install_data == "engine":
-            steps += """<li>Install Docker Engine:
-                <ul>
-                    <li>Download Docker Engine installer</li>
-                    <li>Install Docker Engine binaries</li>
-                    <li>Configure Docker Engine settings</li>
-                </ul>
-            </li>"""
-        elif install_data == "wsl2":
-            steps += """<li>Install Docker Engine with WSL2 backend:
-                <ul>
-                    <li>Download Docker Engine installer</li>
-                    <li>Configure WSL2 integration</li>
-                    <li>Install Docker Engine binaries</li>
-                    <li>Set up WSL2 backend configuration</li>
-                </ul>
-            </li>"""
-        elif install_data == "cli":
-            steps += """<li>Install Docker Engine and CLI:
-                <ul>
-                    <li>Download Docker Engine and CLI installer</li>
-                    <li>Install Docker binaries</li>
-                    <li>Add Docker CLI to PATH</li>
-                </ul>
-            </li>"""
-        
-        # Auto-start configuration
-        if auto_start:
-            steps += """<li>Configure Docker to start automatically:
-                <ul>
-                    <li>Create Windows service for Docker</li>
-                    <li>Set service to start automatically on boot</li>
-                    <li>Start Docker service now</li>
-                </ul>
-            </li>"""
-        else:
-            steps += "<li>Configure Docker for manual start only</li>"
-        
-        # Final steps
-        steps += """<li>Verify installation:
-            <ul>
-                <li>Check Docker service status</li>
-                <li>Run test container to validate installation</li>
-            </ul>
-        </li>"""
-        
-        steps += "</ol>"
-        return steps
-
-    def _get_mac_steps(self):
-        """Get installation steps for macOS custom mode."""
-        install_type = self.mac_install_type.currentText()
-        install_data = self.mac_install_type.currentData()
-        auto_start = self.mac_autostart.isChecked()
-        
-        # Start with header and common steps
-        steps = "<h3>macOS Installation Steps:</h3><ol>"
-        steps += "<li>Check system prerequisites (macOS version, architecture)</li>"
-        steps += "<li>Install Homebrew package manager (if not already installed)</li>"
-        
-        # Installation type specific steps
-        if install_data == "colima":
-            steps += """<li>Set up Docker with Colima:
-                <ul>
-                    <li>Install Docker CLI via Homebrew</li>
-                    <li>Install Colima virtual machine runtime</li>
-                    <li>Configure Colima for Docker compatibility</li>
-                    <li>Initialize Colima environment</li>
-                </ul>
-            </li>"""
-        elif install_data == "cli":
-            steps += """<li>Install Docker CLI only:
-                <ul>
-                    <li>Install Docker CLI via Homebrew</li>
-                    <li>Set up Docker context</li>
-                    <li>Configure Docker environment variables</li>
-                </ul>
-            </li>"""
-        elif install_data == "desktop":
-            steps += """<li>Install Docker Desktop:
-                <ul>
-                    <li>Download Docker Desktop for Mac (.dmg)</li>
-                    <li>Install Docker Desktop application</li>
-                    <li>Set up Docker Desktop preferences</li>
-                </ul>
-            </li>"""
-        
-        # Auto-start configuration
-        if auto_start:
-            if install_data == "colima":
-                steps += """<li>Configure automatic startup:
-                    <ul>
-                        <li>Create LaunchAgent for Colima</li>
-                        <li>Register with macOS startup items</li>
-                        <li>Start Colima service now</li>
-                    </ul>
-                </li>"""
-            elif install_data == "desktop":
-                steps += """<li>Configure automatic startup:
-                    <ul>
-                        <li>Add Docker Desktop to Login Items</li>
-                        <li>Configure Docker Desktop to start on login</li>
-                        <li>Start Docker Desktop now</li>
-                    </ul>
-                </li>"""
-        else:
-            steps += "<li>Skip automatic startup configuration</li>"
-        
-        # Final steps
-        steps += """<li>Verify installation:
-            <ul>
-                <li>Check Docker daemon status</li>
-                <li>Run test container to validate installation</li>
-            </ul>
-        </li>"""
-        
-        steps += "</ol>"
-        return steps
-
-    def _get_linux_steps(self):
-        """Get installation steps for Linux custom mode."""
-        add_user = self.linux_add_user.isChecked()
-        auto_start = self.linux_autostart.isChecked()
-        
-        # Start with header and common steps
-        steps = "<h3>Linux Installation Steps:</h3><ol>"
-        steps += "<li>Detect Linux distribution and version</li>"
-        steps += """<li>Set up Docker repository:
-            <ul>
-                <li>Install required dependencies</li>
-                <li>Add Docker's official GPG key</li>
-                <li>Add Docker repository to APT sources</li>
-                <li>Update package database</li>
-            </ul>
-        </li>"""
-        
-        steps += """<li>Install Docker Engine:
-            <ul>
-                <li>Install Docker Engine, containerd, and Docker CLI</li>
-                <li>Install Docker Compose plugin</li>
-            </ul>
-        </li>"""
-        
-        # User configuration
-        if add_user:
-            steps += """<li>Configure user permissions:
-                <ul>
-                    <li>Create docker group if it doesn't exist</li>
-                    <li>Add current user to docker group</li>
-                    <li>Apply group changes</li>
-                </ul>
-            </li>"""
-        else:
-            steps += "<li>Skip user group configuration (Docker will require sudo)</li>"
-        
-        # Auto-start configuration
-        if auto_start:
-            steps += """<li>Configure Docker to start on boot:
-                <ul>
-                    <li>Enable Docker service with systemd</li>
-                    <li>Start Docker service now</li>
-                </ul>
-            </li>"""
-        else:
-            steps += "<li>Skip automatic startup configuration</li>"
-        
-        # Final steps
-        steps += """<li>Verify installation:
-            <ul>
-                <li>Check Docker daemon status</li>
-                <li>Run test container to validate installation</li>
-                <li>Verify user permissions</li>
-            </ul>
-        </li>"""
-        
-        steps += "</ol>"
-        return steps
+        return _AUTO_STEPS.get(self.current_system, _NO_STEPS_HTML)
@@ -1,15 +1,160 @@
+import os
 import webbrowser
 import subprocess
-import platform
+import shutil
+import shlex
+import sys
+import time
+import functools
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton, 
                           QHBoxLayout, QTextBrowser, QMessageBox,
-                          QWidget, QTabWidget)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QIcon, QPixmap
+                          QWidget, QTabWidget, QApplication)
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QObject, QRunnable, QThreadPool, QPointF, QSize
+from PyQt5.QtGui import (QFont, QIcon, QPixmap, QTextDocument, QStaticText, QPainter,
+                         QColor, QFontMetrics, QPalette)
 
 from app.core.utils.docker_status_checker import DockerStatus
 from app.infrastructure.docker_client import DockerClient
 
+_STATUS_TTL = 1.5  # Seconds a Docker status result is reused
+
+@functools.lru_cache(maxsize=None)
+def _font(point_size, bold=False):
+    """Return a shared font; QFont is implicitly shared and needs a QApplication."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+# Static help pages shipped next to the UI code, like the .qss themes
+_DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "docs")
+
+@functools.lru_cache(maxsize=None)
+def _static_document(name):
+    """Load and parse a static help page once; dialogs display clones of it."""
+    # Owned by the application so it outlives every dialog that displays it
+    document = QTextDocument(QApplication.instance())
+    with open(os.path.join(_DOCS_DIR, name), "r", encoding="utf-8") as file:
+        document.setHtml(file.read())
+    return document
+
+_IS_WINDOWS = sys.platform.startswith("win")
+
+# Terminal emulators tried for the start command, in order of preference
+_TERMINALS = ("gnome-terminal", "xterm", "konsole", "xfce4-terminal", "alacritty")
+
+# Terminals whose -e takes the command as separate arguments instead of one string
+_ARGV_TERMINALS = frozenset({"alacritty"})
+
+@functools.lru_cache(maxsize=1)
+def _find_terminal():
+    """Return the path of the first installed terminal emulator, or None."""
+    return next(filter(None, map(shutil.which, _TERMINALS)), None)
+
+class _StaticTextLabel(QWidget):
+    """Centered single-line label that caches its text layout in a QStaticText."""
+    
+    def __init__(self, text="", parent=None):
+        super().__init__(parent)
+        self._text = ""
+        self._static_text = QStaticText()
+        self._static_text.setTextFormat(Qt.PlainText)
+        self._static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+        self._color = None  # None paints with the palette's text color
+        self.setText(text)
+    
+    def text(self):
+        """Return the full text, even when the painted text is elided."""
+        return self._text
+    
+    def setText(self, text):
+        """Set the displayed text; the layout is rebuilt on the next paint."""
+        self._text = text
+        self._update_elided_text()
+        self.updateGeometry()
+    
+    def set_color(self, color):
+        """Set the text color without going through a stylesheet."""
+        self._color = QColor(color)
+        self.update()
+    
+    def _update_elided_text(self):
+        """Elide the text to the current width and show the full text as a tooltip."""
+        metrics = QFontMetrics(self.font())
+        elided = metrics.elidedText(self._text, Qt.ElideRight, max(self.width() - 4, 0))
+        if elided != self._static_text.text():
+            self._static_text.setText(elided)
+            self.update()
+        self.setToolTip(self._text if elided != self._text else "")
+    
+    def sizeHint(self):
+        """Size the label to its text."""
+        metrics = QFontMetrics(self.font())
+        return QSize(metrics.horizontalAdvance(self._text), metrics.height()) + QSize(4, 4)
+    
+    def minimumSizeHint(self):
+        """Allow the label to shrink horizontally but not vertically."""
+        return QSize(0, self.sizeHint().height())
+    
+    def resizeEvent(self, event):
+        """Re-elide the text for the new width."""
+        super().resizeEvent(event)
+        self._update_elided_text()
+    
+    def changeEvent(self, event):
+        """Re-measure when the font changes."""
+        if event.type() == event.FontChange:
+            self._static_text.setText("")  # Force the layout to be rebuilt with the new font
+            self._update_elided_text()
+            self.updateGeometry()
+        super().changeEvent(event)
+    
+    def paintEvent(self, event):
+        """Draw the cached text centered in the widget."""
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self._color if self._color is not None else self.palette().color(QPalette.WindowText))
+        size = self._static_text.size()
+        if size.isEmpty():
+            self._static_text.prepare(font=self.font())
+            size = self._static_text.size()
+        painter.drawStaticText(QPointF((self.width() - size.width()) / 2,
+                                       (self.height() - size.height()) / 2), self._static_text)
+
+class _StatusSignals(QObject):
+    """Signals for the Docker status worker."""
+    finished = pyqtSignal(object, str)
+
+class _DockerStatusWorker(QRunnable):
+    """Checks Docker status on the global thread pool."""
+    
+    def __init__(self, docker_client):
+        super().__init__()
+        self.docker_client = docker_client
+        self.signals = _StatusSignals()
+    
+    def run(self):
+        """Run the status check and report the result."""
+        try:
+            status, message = self.docker_client.get_docker_status()
+        except Exception as e:
+            status, message = DockerStatus.UNKNOWN, str(e)
+        try:
+            self.signals.finished.emit(status, message)
+        except RuntimeError:
+            pass  # Application shut down while the check was running
+
+class _OpenUrlTask(QRunnable):
+    """Opens a URL in the web browser without blocking the GUI thread."""
+    
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+    
+    def run(self):
+        """Hand the URL to the system browser."""
+        webbrowser.open(self.url)
+
 class DockerSetupDialog(QDialog):
     """Dialog for Docker setup assistance and status checking."""
     
@@ -20,6 +165,10 @@ class DockerSetupDialog(QDialog):
         self.docker_client = DockerClient()
         self.setWindowTitle("Docker Setup Assistant")
         self.setMinimumSize(600, 500)
+        self._status_cache = (0.0, None, None)  # (monotonic time, status, message)
+        self._status_worker = None  # Pending background status check, if any
+        self._closing = False
+        self._last_status = (None, None)  # Last (status, message) shown by update_status_ui
         self.setup_ui()
         
         # Check Docker status when the dialog opens
@@ -31,19 +180,13 @@ class DockerSetupDialog(QDialog):
         
         # Title
         title_label = QLabel("Docker Engine Setup Assistant")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_font(16, bold=True))
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # Status section
-        self.status_label = QLabel("Checking Docker status...")
-        status_font = QFont()
-        status_font.setPointSize(12)
-        self.status_label.setFont(status_font)
-        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label = _StaticTextLabel("Checking Docker status...")
+        self.status_label.setFont(_font(12))
         layout.addWidget(self.status_label)
         
         # Tab widget for different sections
@@ -88,36 +231,9 @@ class DockerSetupDialog(QDialog):
         self.troubleshoot_tab = QWidget()
         troubleshoot_layout = QVBoxLayout(self.troubleshoot_tab)
         
-        troubleshoot_text = QTextBrowser()
-        troubleshoot_text.setHtml("""
-            <h3>Docker Engine Troubleshooting</h3>
-            <p>If you're having trouble with Docker Engine, try these steps:</p>
-            <ol>
-                <li>Ensure your system meets the minimum requirements for Docker Engine</li>
-                <li>For Windows users:
-                    <ul>
-                        <li>Ensure virtualization is enabled in BIOS/UEFI</li>
-                        <li>Ensure WSL2 is properly configured (if using WSL2 method)</li>
-                        <li>Check Windows features to ensure container support is enabled</li>
-                    </ul>
-                </li>
-                <li>For Mac users:
-                    <ul>
-                        <li>Ensure you have sufficient disk space</li>
-                        <li>If using Colima, check its logs with: colima status</li>
-                    </ul>
-                </li>
-                <li>For Linux users:
-                    <ul>
-                        <li>Ensure your user is in the docker group: <code>sudo usermod -aG docker $USER</code></li>
-                        <li>Log out and log back in for group changes to take effect</li>
-                        <li>Check Docker daemon logs with: <code>sudo journalctl -u docker</code></li>
-                    </ul>
-                </li>
-            </ol>
-            <p>For more detailed troubleshooting, visit the <a href="https://docs.docker.com/engine/install/troubleshoot/">Docker Engine troubleshooting guide</a>.</p>
-        """)
-        troubleshoot_layout.addWidget(troubleshoot_text)
+        self._troubleshoot_text = QTextBrowser()
+        self._troubleshoot_text.setOpenExternalLinks(True)
+        troubleshoot_layout.addWidget(self._troubleshoot_text)
         
         self.tab_widget.addTab(self.troubleshoot_tab, "Troubleshooting")
         
@@ -125,37 +241,26 @@ class DockerSetupDialog(QDialog):
         self.postinstall_tab = QWidget()
         postinstall_layout = QVBoxLayout(self.postinstall_tab)
         
-        postinstall_text = QTextBrowser()
-        postinstall_text.setHtml("""
-            <h3>Docker Engine Post-Installation Setup</h3>
-            <p>After installing Docker Engine, complete these recommended steps:</p>
-            <ol>
-                <li><strong>Create the docker group</strong>:
-                    <pre>sudo groupadd docker</pre>
-                </li>
-                <li><strong>Add your user to the docker group</strong>:
-                    <pre>sudo usermod -aG docker $USER</pre>
-                </li>
-                <li><strong>Apply the group change</strong>:
-                    <p>Log out and log back in, or run:</p>
-                    <pre>newgrp docker</pre>
-                </li>
-                <li><strong>Configure Docker to start on boot</strong>:
-                    <p>Linux:</p>
-                    <pre>sudo systemctl enable docker</pre>
-                    <p>macOS (with Colima):</p>
-                    <pre>mkdir -p ~/Library/LaunchAgents
-colima autostart</pre>
-                </li>
-                <li><strong>Test your installation</strong>:
-                    <pre>docker run hello-world</pre>
-                </li>
-            </ol>
-        """)
-        postinstall_layout.addWidget(postinstall_text)
+        self._postinstall_text = QTextBrowser()
+        self._postinstall_text.setOpenExternalLinks(True)
+        postinstall_layout.addWidget(self._postinstall_text)
         
         self.tab_widget.addTab(self.postinstall_tab, "Post-Installation")
         
+        # Static help pages are rendered the first time their tab is shown
+        self._static_pages = {
+            2: (self._troubleshoot_text, "troubleshoot.html"),
+            3: (self._postinstall_text, "postinstall.html"),
+        }
+        self._populated = set()
+        self.tab_widget.currentChanged.connect(self._populate_tab)
+        
+        # Several checks in one event loop turn notify the main app once
+        self._check_signal_timer = QTimer(self)
+        self._check_signal_timer.setSingleShot(True)
+        self._check_signal_timer.setInterval(0)
+        self._check_signal_timer.timeout.connect(self.docker_check_requested.emit)
+        
         layout.addWidget(self.tab_widget)
         
         # Action buttons at the bottom
@@ -178,68 +283,124 @@ colima autostart</pre>
         self.docs_url = ""
         self.start_cmd = None
         
+    def _populate_tab(self, index):
+        """Fill a static help tab with its HTML on first view."""
+        if index in self._populated or index not in self._static_pages:
+            return
+        self._populated.add(index)
+        browser, name = self._static_pages[index]
+        # Each browser gets its own copy: following a link would otherwise clear the shared one
+        browser.setDocument(_static_document(name).clone(browser))
+        
     def check_docker_status(self):
-        """Check Docker status and update UI accordingly."""
-        status, message = self.docker_client.get_docker_status()
+        """Check Docker status in the background and update UI accordingly."""
+        checked_at, status, message = self._status_cache
+        if status is not None and time.monotonic() - checked_at < _STATUS_TTL:
+            self._apply_status(status, message)
+            return
+        if self._status_worker is not None:
+            return  # A check is already running; its result will update the UI
+        
+        self.status_label.setText("Checking Docker status...")
+        self._status_worker = _DockerStatusWorker(self.docker_client)
+        self._status_worker.signals.finished.connect(self._on_status_checked)
+        QThreadPool.globalInstance().start(self._status_worker)
+    
+    @pyqtSlot(object, str)
+    def _on_status_checked(self, status, message):
+        """Cache and show the result of a background status check."""
+        self._status_worker = None
+        self._status_cache = (time.monotonic(), status, message)
+        if not self._closing:
+            self._apply_status(status, message)
+    
+    def _apply_status(self, status, message):
+        """Show a status result and notify the main app."""
         self.update_status_ui(status, message)
         
         # Emit signal so the main app knows to refresh its Docker status
-        self.docker_check_requested.emit()
+        self._check_signal_timer.start()
+    
+    def showEvent(self, event):
+        """Accept status results again when the dialog is shown."""
+        self._closing = False
+        super().showEvent(event)
+    
+    def done(self, result):
+        """Ignore status results that arrive after the dialog is closed."""
+        self._closing = True
+        super().done(result)
     
     def update_status_ui(self, status: DockerStatus, message: str):
         """Update the UI based on Docker status."""
-        if status == DockerStatus.RUNNING:
-            self.status_label.setText("✅ Docker is installed and running")
-            self.status_label.setStyleSheet("color: green;")
-            self.tab_widget.setTabEnabled(0, False)  # Disable installation tab
-            self.tab_widget.setTabEnabled(1, False)  # Disable start tab
-            self.tab_widget.setCurrentIndex(2)  # Show troubleshooting
-        elif status == DockerStatus.INSTALLED_NOT_RUNNING:
-            self.status_label.setText("⚠️ Docker is installed but not running")
-            self.status_label.setStyleSheet("color: orange;")
-            self.tab_widget.setTabEnabled(0, False)  # Disable installation tab
-            self.tab_widget.setTabEnabled(1, True)   # Enable start tab
-            self.tab_widget.setCurrentIndex(1)  # Show start tab
+        # Re-checks usually report the same status; leave the UI untouched then
+        if (status, message) == self._last_status:
+            return
+        self._last_status = (status, message)
+        
+        # Apply the tab changes below as one repaint instead of one per call
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            if status == DockerStatus.RUNNING:
+                self.status_label.setText("✅ Docker is installed and running")
+                self.status_label.set_color("green")
+                self._set_tab_enabled(0, False)  # Disable installation tab
+                self._set_tab_enabled(1, False)  # Disable start tab
+                self.tab_widget.setCurrentIndex(2)  # Show troubleshooting
+            elif status == DockerStatus.INSTALLED_NOT_RUNNING:
+                self.status_label.setText("⚠️ Docker is installed but not running")
+                self.status_label.set_color("orange")
+                self._set_tab_enabled(0, False)  # Disable installation tab
+                self._set_tab_enabled(1, True)   # Enable start tab
+                self.tab_widget.setCurrentIndex(1)  # Show start tab
             
-            # Update start instructions
-            start_info = self.docker_client.get_start_instructions()
-            self.start_instructions.setHtml(f"<h3>{start_info['title']}</h3><p>{start_info['instructions']}</p>")
-            self.start_cmd = start_info.get('command')
-            self.start_command_button.setEnabled(self.start_cmd is not None)
+                # Update start instructions
+                start_info = self.docker_client.get_start_instructions()
+                self.start_instructions.setHtml(f"<h3>{start_info['title']}</h3><p>{start_info['instructions']}</p>")
+                self.start_cmd = start_info.get('command')
+                self.start_command_button.setEnabled(self.start_cmd is not None)
             
-        elif status == DockerStatus.NOT_INSTALLED:
-            self.status_label.setText("❌ Docker Engine is not installed")
-            self.status_label.setStyleSheet("color: red;")
-            self.tab_widget.setTabEnabled(0, True)   # Enable installation tab
-            self.tab_widget.setTabEnabled(1, False)  # Disable start tab
-            self.tab_widget.setCurrentIndex(0)  # Show installation tab
+            elif status == DockerStatus.NOT_INSTALLED:
+                self.status_label.setText("❌ Docker Engine is not installed")
+                self.status_label.set_color("red")
+                self._set_tab_enabled(0, True)   # Enable installation tab
+                self._set_tab_enabled(1, False)  # Disable start tab
+                self.tab_widget.setCurrentIndex(0)  # Show installation tab
             
-            # Update installation instructions
-            install_info = self.docker_client.get_installation_instructions()
-            self.install_instructions.setHtml(
-                f"<h3>{install_info['title']}</h3>"
-                f"<p>{install_info['instructions']}</p>"
-                f"<p>Visit documentation: <a href='{install_info['docs_url']}'>{install_info['docs_url']}</a></p>"
-            )
-            self.download_url = install_info['download_url']
-            self.docs_url = install_info['docs_url']
+                # Update installation instructions
+                install_info = self.docker_client.get_installation_instructions()
+                self.install_instructions.setHtml(
+                    f"<h3>{install_info['title']}</h3>"
+                    f"<p>{install_info['instructions']}</p>"
+                    f"<p>Visit documentation: <a href='{install_info['docs_url']}'>{install_info['docs_url']}</a></p>"
+                )
+                self.download_url = install_info['download_url']
+                self.docs_url = install_info['docs_url']
             
-        else:  # UNKNOWN
-            self.status_label.setText(f"❓ Docker status unknown: {message}")
-            self.status_label.setStyleSheet("color: gray;")
-            # Show all tabs
-            self.tab_widget.setTabEnabled(0, True)
-            self.tab_widget.setTabEnabled(1, True)
+            else:  # UNKNOWN
+                self.status_label.setText(f"❓ Docker status unknown: {message}")
+                self.status_label.set_color("gray")
+                # Show all tabs
+                self._set_tab_enabled(0, True)
+                self._set_tab_enabled(1, True)
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+            self.tab_widget.update()
+    
+    def _set_tab_enabled(self, index, enabled):
+        """Enable or disable a tab only when its state actually changes."""
+        if self.tab_widget.isTabEnabled(index) != enabled:
+            self.tab_widget.setTabEnabled(index, enabled)
     
     def open_download_url(self):
         """Open the Docker download URL in web browser."""
         if self.download_url:
-            webbrowser.open(self.download_url)
+            QThreadPool.globalInstance().start(_OpenUrlTask(self.download_url))
     
     def open_docs_url(self):
         """Open the Docker documentation URL in web browser."""
         if self.docs_url:
-            webbrowser.open(self.docs_url)
+            QThreadPool.globalInstance().start(_OpenUrlTask(self.docs_url))
     
     def run_start_command(self):
         """Run the start Docker command if available."""
@@ -247,18 +408,22 @@ colima autostart</pre>
             return
         
         try:
-            if platform.system().lower() == "windows":
-                # On Windows, open a command prompt to run the command
-                subprocess.Popen(f"cmd.exe /c start cmd.exe /k {self.start_cmd}")
+            if _IS_WINDOWS:
+                # On Windows, open a command prompt in its own console to run the command
+                subprocess.Popen(["cmd.exe", "/k", self.start_cmd],
+                                 creationflags=subprocess.CREATE_NEW_CONSOLE)
             else:
                 # On Unix systems, we'd need a terminal emulator
-                # This is system-dependent, but try common ones
-                for terminal in ["gnome-terminal", "xterm", "konsole"]:
-                    try:
-                        subprocess.Popen([terminal, "-e", f"bash -c '{self.start_cmd}; read -p \"Press Enter to close...\"'"])
-                        break
-                    except FileNotFoundError:
-                        continue
+                # This is system-dependent, so look up common ones on PATH
+                terminal = _find_terminal()
+                if terminal:
+                    script = f"{self.start_cmd}; read -p 'Press Enter to close...'"
+                    if os.path.basename(terminal) in _ARGV_TERMINALS:
+                        command = [terminal, "-e", "bash", "-c", script]
+                    else:
+                        # -e takes a single command string here, so quote it for bash
+                        command = [terminal, "-e", f"bash -c {shlex.quote(script)}"]
+                    subprocess.Popen(command)
                 else:
                     # If no terminal found, show the command for user to manually run
                     QMessageBox.information(
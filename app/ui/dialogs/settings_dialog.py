@@ -1,11 +1,22 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
-                           QTabWidget, QWidget, QFormLayout, QLineEdit, 
-                           QCheckBox, QLabel, QSpinBox, QComboBox, QDialogButtonBox)
-from PyQt5.QtCore import Qt, QSettings
+                           QTabWidget, QWidget, QGridLayout, QLineEdit, 
+                           QCheckBox, QLabel, QSpinBox, QComboBox)
+from PyQt5.QtCore import QSettings, QTimer
 from app.ui.theme_manager import ThemeManager
 from app.core.utils.logging_config import LoggingConfig
 import logging
 
+def _grid_form(widget, rows):
+    """Lay out fixed (label, field) rows in a two-column grid on widget."""
+    layout = QGridLayout(widget)
+    for row, (label, field) in enumerate(rows):
+        if label:
+            layout.addWidget(QLabel(label), row, 0)
+        layout.addWidget(field, row, 1)
+    layout.setColumnStretch(1, 1)
+    layout.setRowStretch(len(rows), 1)  # Keep the rows at the top like a form
+    return layout
+
 class SettingsDialog(QDialog):
     """Dialog for application settings."""
     
@@ -18,30 +29,33 @@ class SettingsDialog(QDialog):
         # Load settings
         self.settings = QSettings("LiDoMa", "DockerManager")
         
+        # Per-tab (builder, settings loader, settings saver, label); tabs are built on first view
+        self._tabs = (
+            (self.create_general_tab, self._load_general, self._save_general, "General"),
+            (self.create_docker_tab, self._load_docker, self._save_docker, "Docker"),
+            (self.create_display_tab, self._load_display, self._save_display, "Display"),
+        )
+        self._tabs_built = set()
+        self._snapshot = None  # Stored values, read in one pass when the first tab loads
+        
         self.initUI()
-        self.loadSettings()
     
     def initUI(self):
         """Initialize the UI components."""
         layout = QVBoxLayout()
         self.setLayout(layout)
         
-        # Create tab widget
-        tab_widget = QTabWidget()
-        
-        # General tab
-        general_tab = self.create_general_tab()
-        tab_widget.addTab(general_tab, "General")
-        
-        # Docker tab
-        docker_tab = self.create_docker_tab()
-        tab_widget.addTab(docker_tab, "Docker")
-        
-        # Display tab
-        display_tab = self.create_display_tab()
-        tab_widget.addTab(display_tab, "Display")
+        # Create tab widget with empty pages; each is filled the first time it is shown
+        self.tab_widget = QTabWidget()
+        for _, _, _, label in self._tabs:
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, label)
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tab_widget.currentIndex())
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.tab_widget)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -58,39 +72,46 @@ class SettingsDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _ensure_tab(self, index):
+        """Build and load the settings of a tab the first time it is shown."""
+        if index < 0 or index in self._tabs_built:
+            return
+        self._tabs_built.add(index)
+        build, load, _, _ = self._tabs[index]
+        self.tab_widget.widget(index).layout().addWidget(build())
+        load()
+    
     def create_general_tab(self):
         """Create the general settings tab."""
         widget = QWidget()
-        layout = QFormLayout(widget)
         
         # Check for updates on startup
         self.check_updates = QCheckBox("Check for updates on startup")
-        layout.addRow("Updates:", self.check_updates)
         
         # Log settings
         self.log_level = QComboBox()
         self.log_level.addItems(["Debug", "Info", "Warning", "Error"])
-        layout.addRow("Log Level:", self.log_level)
         
         self.max_log_entries = QSpinBox()
         self.max_log_entries.setRange(100, 10000)
         self.max_log_entries.setSingleStep(100)
-        layout.addRow("Max Log Entries:", self.max_log_entries)
         
+        _grid_form(widget, (
+            ("Updates:", self.check_updates),
+            ("Log Level:", self.log_level),
+            ("Max Log Entries:", self.max_log_entries),
+        ))
         return widget
     
     def create_docker_tab(self):
         """Create the Docker settings tab."""
         widget = QWidget()
-        layout = QFormLayout(widget)
         
         # Docker path
         self.docker_path = QLineEdit()
-        layout.addRow("Docker Executable:", self.docker_path)
         
         # Docker compose path
         self.compose_path = QLineEdit()
-        layout.addRow("Docker Compose Executable:", self.compose_path)
         
         # Auto-refresh interval
         self.refresh_interval = QSpinBox()
@@ -98,87 +119,107 @@ class SettingsDialog(QDialog):
         self.refresh_interval.setSingleStep(5)
         self.refresh_interval.setSpecialValueText("Disabled")
         self.refresh_interval.setSuffix(" seconds")
-        layout.addRow("Auto-refresh Interval:", self.refresh_interval)
         
+        _grid_form(widget, (
+            ("Docker Executable:", self.docker_path),
+            ("Docker Compose Executable:", self.compose_path),
+            ("Auto-refresh Interval:", self.refresh_interval),
+        ))
         return widget
     
     def create_display_tab(self):
         """Create the display settings tab."""
         widget = QWidget()
-        layout = QFormLayout(widget)
         
         # Theme selection
+        self._theme_preview_timer = QTimer(self)
+        self._theme_preview_timer.setSingleShot(True)
+        self._theme_preview_timer.setInterval(150)
+        self._theme_preview_timer.timeout.connect(self._apply_theme_preview)
         self.theme = QComboBox()
         self.theme.addItems(["Dark", "Light", "System"])
         # Connect theme change signal
         self.theme.currentTextChanged.connect(self.on_theme_preview)
-        layout.addRow("Theme:", self.theme)
         
         # Font size
         self.font_size = QSpinBox()
         self.font_size.setRange(8, 16)
         self.font_size.setSingleStep(1)
         self.font_size.setSuffix(" pt")
-        layout.addRow("UI Font Size:", self.font_size)
         
         # Add note about theme preview
         note = QLabel("Note: Theme changes are previewed immediately but will be fully applied on restart.")
         note.setWordWrap(True)
-        layout.addRow("", note)
         
+        _grid_form(widget, (
+            ("Theme:", self.theme),
+            ("UI Font Size:", self.font_size),
+            ("", note),
+        ))
         return widget
     
     def on_theme_preview(self, theme_name):
         """Preview theme when changed in settings."""
-        # Apply the theme immediately for preview
+        # Wait for the selection to settle so scrolling through themes restyles once
+        self._theme_preview_timer.start()
+    
+    def _apply_theme_preview(self):
+        """Apply the selected theme for preview."""
+        theme_name = self.theme.currentText()
+        if theme_name == ThemeManager.get_current_theme():
+            return
+        # The application stylesheet propagates to this dialog and its children
         ThemeManager.apply_theme(theme_name)
-        
-        # Force update on the dialog and all its children
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
-        
-        # Refresh this dialog to ensure all components update
-        ThemeManager.refresh_widget_style(self)
     
     def loadSettings(self):
-        """Load settings from QSettings."""
-        # General tab
-        self.check_updates.setChecked(self.settings.value("checkUpdates", True, type=bool))
-        self.log_level.setCurrentText(self.settings.value("logLevel", "Info"))
-        self.max_log_entries.setValue(self.settings.value("maxLogEntries", 1000, type=int))
-        
-        # Docker tab
-        self.docker_path.setText(self.settings.value("dockerPath", "docker"))
-        self.compose_path.setText(self.settings.value("composePath", "docker-compose"))
-        self.refresh_interval.setValue(self.settings.value("refreshInterval", 0, type=int))
-        
-        # Display tab
-        self.theme.setCurrentText(self.settings.value("theme", "Dark"))
-        self.font_size.setValue(self.settings.value("fontSize", 9, type=int))
+        """Load settings from QSettings into every tab built so far."""
+        for index in self._tabs_built:
+            self._tabs[index][1]()
+    
+    def _stored(self, key, default, cast=str):
+        """Read a setting from a snapshot of the store taken on first use."""
+        if self._snapshot is None:
+            self._snapshot = {key: self.settings.value(key) for key in self.settings.allKeys()}
+        value = self._snapshot.get(key)
+        if value is None:
+            return default
+        if cast is bool and isinstance(value, str):
+            # INI-backed settings return booleans as strings
+            return value.lower() in ("true", "1")
+        return cast(value)
+    
+    def _load_general(self):
+        """Load the general tab settings."""
+        self.check_updates.setChecked(self._stored("checkUpdates", True, bool))
+        self.log_level.setCurrentText(self._stored("logLevel", "Info"))
+        self.max_log_entries.setValue(self._stored("maxLogEntries", 1000, int))
+    
+    def _load_docker(self):
+        """Load the Docker tab settings."""
+        self.docker_path.setText(self._stored("dockerPath", "docker"))
+        self.compose_path.setText(self._stored("composePath", "docker-compose"))
+        self.refresh_interval.setValue(self._stored("refreshInterval", 0, int))
+    
+    def _load_display(self):
+        """Load the display tab settings."""
+        self.theme.setCurrentText(self._stored("theme", "Dark"))
+        self.font_size.setValue(self._stored("fontSize", 9, int))
     
     def save_settings(self):
         """Save settings to QSettings."""
-        # General tab
-        self.settings.setValue("checkUpdates", self.check_updates.isChecked())
-        
-        # Get old log level for comparison
+        # Get old values for comparison
         old_log_level = self.settings.value("logLevel", "Info")
-        new_log_level = self.log_level.currentText()
+        old_theme = self.settings.value("theme", "Dark")
         
-        self.settings.setValue("logLevel", new_log_level)
-        self.settings.setValue("maxLogEntries", self.max_log_entries.value())
+        # Tabs never opened still hold the stored values, so only built tabs are saved
+        for index in self._tabs_built:
+            self._tabs[index][2]()
         
-        # Docker tab
-        self.settings.setValue("dockerPath", self.docker_path.text())
-        self.settings.setValue("composePath", self.compose_path.text())
-        self.settings.setValue("refreshInterval", self.refresh_interval.value())
+        new_log_level = self.settings.value("logLevel", "Info")
+        new_theme = self.settings.value("theme", "Dark")
         
-        # Display tab
-        old_theme = self.settings.value("theme", "Dark")
-        new_theme = self.theme.currentText()
-        self.settings.setValue("theme", new_theme)
-        self.settings.setValue("fontSize", self.font_size.value())
+        # Flush all writes to the backing store at once
+        self.settings.sync()
         
         # Apply log level change if needed
         if old_log_level != new_log_level:
@@ -187,7 +228,12 @@ class SettingsDialog(QDialog):
         
         # Apply theme if changed - ensure it's fully applied
         if old_theme != new_theme:
-            ThemeManager.apply_theme(new_theme)
+            # Repaint the dialog once after the new stylesheet is in place
+            self.setUpdatesEnabled(False)
+            try:
+                ThemeManager.apply_theme(new_theme)
+            finally:
+                self.setUpdatesEnabled(True)
             
             # Notify the user that some changes might require restart for full effect
             from PyQt5.QtWidgets import QMessageBox
@@ -195,3 +241,20 @@ class SettingsDialog(QDialog):
                                    "The theme has been changed and applied. Some elements may require application restart to display correctly.")
         
         self.accept()
+    
+    def _save_general(self):
+        """Save the general tab settings."""
+        self.settings.setValue("checkUpdates", self.check_updates.isChecked())
+        self.settings.setValue("logLevel", self.log_level.currentText())
+        self.settings.setValue("maxLogEntries", self.max_log_entries.value())
+    
+    def _save_docker(self):
+        """Save the Docker tab settings."""
+        self.settings.setValue("dockerPath", self.docker_path.text())
+        self.settings.setValue("composePath", self.compose_path.text())
+        self.settings.setValue("refreshInterval", self.refresh_interval.value())
+    
+    def _save_display(self):
+        """Save the display tab settings."""
+        self.settings.setValue("theme", self.theme.currentText())
+        self.settings.setValue("fontSize", self.font_size.value())
@@ -1,9 +1,9 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QApplication, QSplitter, 
                             QShortcut, QStatusBar, QTabWidget, QFrame, QHBoxLayout, QMessageBox,
                             QStackedWidget)
-from PyQt5.QtCore import Qt, QSettings, QTimer
+from PyQt5.QtCore import Qt, QSettings, QThreadPool, QTimer
 from PyQt5.QtGui import QFont, QKeySequence
-from datetime import datetime
+from functools import partial
 import logging
 import traceback
 
@@ -49,21 +49,32 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger(__name__)
 
 from app.ui.utils.thread_manager import ThreadManager
+from app.ui.utils.settings_writer import SettingsWriter
 
 class DockerManagerApp(QMainWindow):
     """Main application window for Docker Manager."""
     
+    _settings = None  # Shared QSettings, created on first use
+    
     def __init__(self, main_viewmodel: MainViewModel):
         super().__init__()
         self.setWindowTitle("Docker Manager")
         self.resize(1000, 700)
         
         # Set up application settings
-        self.settings = QSettings("LiDoMa", "DockerManager")
+        self.settings = self._shared_settings()
+        self._saved_state = {}  # Last geometry/state values read from or written to settings
+        self._settings_writer = SettingsWriter("LiDoMa", "DockerManager", self)
+        # Stop the writer on every teardown path, not just closeEvent, so the
+        # QThread is never destroyed while running
+        self.destroyed.connect(self._settings_writer.stop)
+        QApplication.instance().aboutToQuit.connect(self._settings_writer.stop)
+        self._settings_writer.start()
         self.load_settings()
         
         # Store the main viewmodel
         self.main_viewmodel = main_viewmodel
+        self._docker_setup_dialog = None  # Built on first use and reused afterwards
         
         # Get the docker service from the main viewmodel
         self.docker_service = main_viewmodel.docker_service
@@ -88,10 +99,22 @@ class DockerManagerApp(QMainWindow):
         self.main_viewmodel.refresh_completed.connect(self.handle_refresh_completed)
         
         # Initialize thread tracking
-        self.refresh_worker = None
-        self.active_workers = []
+        self.refresh_worker = None  # Current pooled RefreshWorker, if any
         self.thread_manager = ThreadManager.instance()
         
+        # Coalesce search keystrokes into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(self._do_filter)
+        
+        # Buffer log lines and hand them to the log widget in batches
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+        
         # Initialize UI
         self.init_ui()
         self.setup_shortcuts()
@@ -113,11 +136,8 @@ class DockerManagerApp(QMainWindow):
         logger.info("Docker Manager UI initialized")
         self.log("Application started")
         
-        # Load Docker contexts after a short delay to ensure UI is visible first
-        QTimer.singleShot(500, self.load_contexts)
-        
-        # Check Docker availability after a short delay
-        QTimer.singleShot(1500, self.check_docker_connection)
+        # Docker availability is checked on the first showEvent, once the window is up
+        self._shown_once = False
 
         # Initialize logging configuration
         LoggingConfig.apply_log_level_from_settings()
@@ -166,17 +186,23 @@ class DockerManagerApp(QMainWindow):
         self.tabs.setDocumentMode(True)
         self.tabs.setElideMode(Qt.ElideRight)
         
-        # Create tab views
-        self.container_tab = ContainerTabView(self, self.container_viewmodel)
-        self.image_tab = ImageTabView(self, self.image_viewmodel)
-        self.volume_tab = VolumeTabView(self, self.volume_viewmodel)
-        self.network_tab = NetworkTabView(self, self.network_viewmodel)
-        
-        # Add tabs to tab widget
-        self.tabs.addTab(self.container_tab, "Containers")
-        self.tabs.addTab(self.image_tab, "Images")
-        self.tabs.addTab(self.volume_tab, "Volumes")
-        self.tabs.addTab(self.network_tab, "Networks")
+        # Add placeholder tabs; each view is built the first time its tab is shown.
+        # Specs are keyed by placeholder because the tabs can be reordered.
+        self._tab_specs = {}
+        self._tab_rows = {}  # Rows from the last refresh, by tab attribute
+        for attr, view_class, viewmodel, label in (
+            ("container_tab", ContainerTabView, self.container_viewmodel, "Containers"),
+            ("image_tab", ImageTabView, self.image_viewmodel, "Images"),
+            ("volume_tab", VolumeTabView, self.volume_viewmodel, "Volumes"),
+            ("network_tab", NetworkTabView, self.network_viewmodel, "Networks"),
+        ):
+            setattr(self, attr, None)
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._tab_specs[placeholder] = (attr, view_class, viewmodel)
+            self.tabs.addTab(placeholder, label)
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tabs.currentIndex())
         
         tabs_layout.addWidget(self.tabs)
         docker_available_layout.addWidget(tabs_container)
@@ -203,6 +229,11 @@ class DockerManagerApp(QMainWindow):
         # Add log widget to splitter
         self.main_splitter.addWidget(self.log_widget)
         
+        # The splitter didn't exist yet when load_settings ran; restore it from the values read there
+        splitter_state = self._saved_state.get("splitterState")
+        if splitter_state:
+            self.main_splitter.restoreState(splitter_state)
+        
         # Add splitter to main layout
         main_layout.addWidget(self.main_splitter)
         
@@ -236,35 +267,60 @@ class DockerManagerApp(QMainWindow):
         # Switch tabs shortcuts
         for i in range(4):
             tab_shortcut = QShortcut(QKeySequence(f"Ctrl+{i+1}"), self)
-            tab_shortcut.activated.connect(lambda idx=i: self.tabs.setCurrentIndex(idx))
+            tab_shortcut.activated.connect(partial(self.tabs.setCurrentIndex, i))
         
         # Clear log (Ctrl+L)
         clear_log_shortcut = QShortcut(QKeySequence("Ctrl+L"), self)
         clear_log_shortcut.activated.connect(self.log_widget.clear)
 
+    @classmethod
+    def _shared_settings(cls):
+        """Return the QSettings instance shared by all main windows."""
+        if cls._settings is None:
+            cls._settings = QSettings("LiDoMa", "DockerManager")
+        return cls._settings
+
     def load_settings(self):
         """Load application settings."""
+        # Read all window state keys in one pass and keep them for later comparison
+        for key in ("geometry", "windowState", "splitterState"):
+            value = self.settings.value(key)
+            if value:
+                self._saved_state[key] = value
+        
         # Window geometry
-        geometry = self.settings.value("geometry")
+        geometry = self._saved_state.get("geometry")
         if geometry:
             self.restoreGeometry(geometry)
         
         # Window state
-        state = self.settings.value("windowState")
+        state = self._saved_state.get("windowState")
         if state:
             self.restoreState(state)
         
         # Splitter state
-        splitter_state = self.settings.value("splitterState")
+        splitter_state = self._saved_state.get("splitterState")
         if splitter_state and hasattr(self, 'main_splitter'):
             self.main_splitter.restoreState(splitter_state)
 
     def save_settings(self):
         """Save application settings."""
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("windowState", self.saveState())
+        values = {"geometry": self.saveGeometry(), "windowState": self.saveState()}
         if hasattr(self, 'main_splitter'):
-            self.settings.setValue("splitterState", self.main_splitter.saveState())
+            values["splitterState"] = self.main_splitter.saveState()
+        
+        # Only queue values that changed; the writer thread does the disk I/O
+        changed = {key: value for key, value in values.items() if value != self._saved_state.get(key)}
+        if changed:
+            self._saved_state.update(changed)
+            self._settings_writer.write(changed)
+
+    def showEvent(self, event):
+        """Start the initial Docker check the first time the window is shown."""
+        super().showEvent(event)
+        if not self._shown_once:
+            self._shown_once = True
+            QTimer.singleShot(0, self.check_docker_connection)
 
     def closeEvent(self, event):
         """Handle window close event to save settings and clean up threads."""
@@ -279,13 +335,13 @@ class DockerManagerApp(QMainWindow):
         if hasattr(self, 'log_handler') and self.log_handler in root_logger.handlers:
             root_logger.removeHandler(self.log_handler)
         
-        # Terminate any running worker threads
-        for worker in self.active_workers:
-            if worker.is_running:
-                worker.terminate()
-                worker.wait()  # Wait for thread to finish
+        # Stop any running refresh and give pooled workers a moment to finish
+        if self.refresh_worker:
+            self.refresh_worker.cancel()
+        QThreadPool.globalInstance().waitForDone(2000)
         
         self.save_settings()
+        self._settings_writer.stop()  # Drains pending writes before the thread exits
         super().closeEvent(event)
 
     def focus_search(self):
@@ -294,11 +350,40 @@ class DockerManagerApp(QMainWindow):
 
     def filter_tables(self):
         """Filter all resource tables based on search text"""
+        # Restarting the timer pushes the filter back until typing pauses
+        self._filter_timer.start()
+
+    def _do_filter(self):
+        """Apply the current search text to all resource tables."""
         search_text = self.header_widget.get_search_widget().get_search_text().lower()
-        self.container_tab.filter_table(search_text)
-        self.image_tab.filter_table(search_text)
-        self.volume_tab.filter_table(search_text)
-        self.network_tab.filter_table(search_text)
+        for view in self._built_tab_views():
+            view.filter_table(search_text)
+
+    def _ensure_tab(self, index):
+        """Build the view behind a placeholder tab the first time it is shown."""
+        placeholder = self.tabs.widget(index)
+        spec = self._tab_specs.pop(placeholder, None)
+        if spec is None:
+            return
+        attr, view_class, viewmodel = spec
+        view = view_class(self, viewmodel)
+        placeholder.layout().addWidget(view)
+        setattr(self, attr, view)
+        
+        # Catch up on data and filtering that arrived before the view existed
+        view.bulk_set_rows(self._tab_rows.get(attr, []))
+        view.filter_table(self.header_widget.get_search_widget().get_search_text().lower())
+
+    def _built_tab_views(self):
+        """Return the tab views that have been built so far."""
+        views = (self.container_tab, self.image_tab, self.volume_tab, self.network_tab)
+        return [view for view in views if view is not None]
+
+    def _clear_tables(self):
+        """Clear all resource tables and the rows cached for unbuilt tabs."""
+        self._tab_rows = {}
+        for view in self._built_tab_views():
+            view.clear_table()
 
     def log(self, message):
         """Log a message through the logging system."""
@@ -308,8 +393,16 @@ class DockerManagerApp(QMainWindow):
         self.status_label.setText(message.split('\n')[0])
     
     def append_to_log(self, formatted_message):
-        """Append a pre-formatted log message to the log widget."""
-        self.log_widget.append(formatted_message)
+        """Queue a pre-formatted log message for the log widget."""
+        self._log_buffer.append(formatted_message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_buffer(self):
+        """Append all queued log messages to the log widget in one call."""
+        if self._log_buffer:
+            self.log_widget.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def refresh_data(self, refresh_contexts=True):
         """Starts the worker thread to refresh all Docker resource data."""
@@ -318,29 +411,9 @@ class DockerManagerApp(QMainWindow):
         self.error_handler.clear_error()
         
         # Clear tables 
-        self.container_tab.clear_table()
-        self.image_tab.clear_table()
-        self.volume_tab.clear_table()
-        self.network_tab.clear_table()
-        
-        # Always refresh contexts first to ensure we have the latest Docker environments
-        self.log("Refreshing Docker contexts...")
+        self._clear_tables()
         
-        # Force a refresh of the Docker contexts cache
-        if hasattr(self.main_viewmodel, 'invalidate_contexts_cache'):
-            self.main_viewmodel.invalidate_contexts_cache()
-        
-        # Get updated contexts
-        contexts, error = self.main_viewmodel.get_docker_contexts()
-        if error:
-            self.error_handler.show_error(f"Error refreshing Docker contexts: {error}")
-        else:
-            # Update context selector
-            current_context = self.context_selector.get_current_context()
-            self.context_selector.set_contexts(contexts, current_context)
-            self.log(f"Found {len(contexts)} Docker contexts")
-        
-        # Now refresh the selected context's resources
+        # Contexts are fetched as part of the resource refresh below
         current_context = self.context_selector.get_current_context()
         
         # Log refresh operation
@@ -353,24 +426,23 @@ class DockerManagerApp(QMainWindow):
         
         # Perform refresh through viewmodel
         try:
-            self.main_viewmodel.refresh_all_resources()
+            self.main_viewmodel.refresh_all_resources(refresh_contexts)
             return
         except Exception as e:
             # Fall back to the original refresh logic
             self.logger.error(f"Error using viewmodel refresh: {str(e)}")
             
-            # Cancel any existing refresh operation
-            if self.refresh_worker and self.refresh_worker.is_running:
-                self.refresh_worker.terminate()
-                self.refresh_worker.wait()
+            # Cancel any existing refresh operation; it stops before its next fetch
+            if self.refresh_worker:
+                self.refresh_worker.cancel()
             
-            # Create and start worker thread
+            # Create and start worker on the global thread pool
             try:
-                self.refresh_worker = RefreshWorker(self.docker_service)
-                self.refresh_worker.results_ready.connect(self.on_refresh_complete)
+                self.refresh_worker = RefreshWorker(self.docker_service, refresh_contexts)
+                self.refresh_worker.signals.results_ready.connect(self.on_refresh_complete)
                 self.refresh_worker.signals.error.connect(self.on_refresh_error)
                 self.refresh_worker.signals.log.connect(self.log)
-                self.thread_manager.start_thread(self.refresh_worker)
+                QThreadPool.globalInstance().start(self.refresh_worker)
             except Exception as e:
                 error_msg = f"Failed to start refresh worker: {str(e)}"
                 self.logger.error(error_msg)
@@ -399,12 +471,12 @@ class DockerManagerApp(QMainWindow):
                 f"{error_msg}\n\nPlease ensure Docker is running and properly configured."
             ))
 
-    def on_refresh_complete(self, containers, images, volumes, networks, error):
+    def on_refresh_complete(self, containers, images, volumes, networks, contexts, error):
         """Slot called when the refresh worker finishes."""        
         try:
-            # Clean up worker
-            if self.refresh_worker in self.active_workers:
-                self.active_workers.remove(self.refresh_worker)
+            # Contexts fetched alongside the resources, if any
+            if contexts:
+                self.update_contexts(contexts)
             
             if error:
                 self.log(error)
@@ -423,38 +495,26 @@ class DockerManagerApp(QMainWindow):
                 # Log the counts
                 self.log(status_msg)
             
-                # Update resource tables
-                for container in containers:
-                    # Make sure container has a context field
-                    if "context" not in container:
-                        container["context"] = "default"
-                    self.container_tab.add_container_row(container)
-                    
-                for image in images:
-                    # Make sure image has a context field
-                    if "context" not in image:
-                        image["context"] = "default"
-                    self.image_tab.add_image_row(image)
-                    
-                for volume in volumes:
-                    # Make sure volume has a context field
-                    if "context" not in volume:
-                        volume["context"] = "default"
-                    self.volume_tab.add_volume_row(volume)
-                    
-                for network in networks:
-                    # Make sure network has a context field
-                    if "context" not in network:
-                        network["context"] = "default"
-                    self.network_tab.add_network_row(network)
+                # Make sure every resource has a context field
+                for resources in (containers, images, volumes, networks):
+                    for resource in resources:
+                        resource.setdefault("context", "default")
+                
+                # Update built tables in one batch per tab; the rest fill in when first shown
+                self._tab_rows = {
+                    "container_tab": containers,
+                    "image_tab": images,
+                    "volume_tab": volumes,
+                    "network_tab": networks,
+                }
+                for attr, rows in self._tab_rows.items():
+                    view = getattr(self, attr)
+                    if view is not None:
+                        view.bulk_set_rows(rows)
                     
                 self.log("Docker data refreshed.")
             
             self.header_widget.enable_refresh()
-            
-            # Reapply any active filters
-            if self.header_widget.get_search_widget().get_search_text():
-                self.filter_tables()
         except Exception as e:
             error_msg = f"Error updating UI with Docker data: {str(e)}"
             logger.error(error_msg)
@@ -567,8 +627,7 @@ class DockerManagerApp(QMainWindow):
             
     def apply_settings(self):
         """Apply changes from settings."""
-        self.settings = QSettings("LiDoMa", "DockerManager")
-        
+        # The shared QSettings sees the dialog's writes; no need to reopen the store
         # Apply theme
         current_theme = self.settings.value("theme", "Dark")
         ThemeManager.apply_theme(current_theme)
@@ -608,14 +667,12 @@ class DockerManagerApp(QMainWindow):
         self.status_label.setText("Refreshing Docker resources...")
         
         # Clear tables
-        self.container_tab.clear_table()
-        self.image_tab.clear_table()
-        self.volume_tab.clear_table()
-        self.network_tab.clear_table()
+        self._clear_tables()
     
     def handle_refresh_completed(self, containers, images, volumes, networks, error):
         """Handle refresh completed signal from the viewmodel."""
-        self.on_refresh_complete(containers, images, volumes, networks, error)
+        # The viewmodel already published its contexts through contexts_changed
+        self.on_refresh_complete(containers, images, volumes, networks, [], error)
 
     def show_docker_available_view(self):
         """Show the Docker available view."""
@@ -643,8 +700,8 @@ class DockerManagerApp(QMainWindow):
                 
             if is_available:
                 self.show_docker_available_view()
-                # Refresh data once we confirm Docker is available
-                QTimer.singleShot(500, self.refresh_data)
+                # Refresh data (contexts included) on the next event loop pass
+                QTimer.singleShot(0, self.refresh_data)
             else:
                 self.show_docker_unavailable_view()
         except Exception as e:
@@ -692,7 +749,11 @@ class DockerManagerApp(QMainWindow):
             return False
 
     def show_docker_setup_assistant(self):
-        from app.ui.dialogs.docker_setup_dialog import DockerSetupDialog
-        dialog = DockerSetupDialog(self)
-        dialog.docker_check_requested.connect(self.check_docker_availability)
-        dialog.exec_()
+        if self._docker_setup_dialog is None:
+            from app.ui.dialogs.docker_setup_dialog import DockerSetupDialog
+            self._docker_setup_dialog = DockerSetupDialog(self)
+            self._docker_setup_dialog.docker_check_requested.connect(self.check_docker_availability)
+        else:
+            # A new dialog checks on construction; a reused one needs a fresh check
+            self._docker_setup_dialog.check_docker_status()
+        self._docker_setup_dialog.exec_()
@@ -83,8 +83,13 @@ class DockerErrorHandlingMixin:
         self.logger.info(f"Docker status: {status.value}, {message}")
     
     def show_docker_setup_assistant(self):
-        dialog = DockerSetupDialog(self)
-        dialog.docker_check_requested.connect(self.check_docker_availability)
+        # Mixins have no __init__ of their own, so the cached dialog is created lazily here
+        dialog = getattr(self, "_docker_setup_dialog", None)
+        if dialog is None:
+            dialog = self._docker_setup_dialog = DockerSetupDialog(self)
+            dialog.docker_check_requested.connect(self.check_docker_availability)
+        else:
+            dialog.check_docker_status()
         dialog.exec_()
         
     def update_docker_feature_availability(self, available):
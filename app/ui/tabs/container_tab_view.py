@@ -2,12 +2,21 @@
 Tab view for displaying and managing Docker containers.
 """
 from typing import Dict, List
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableView, 
                            QPushButton, QHBoxLayout, QHeaderView, QMenu, QAction, QMessageBox)
 from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtGui import QBrush
 
 from app.ui.viewmodels.container_viewmodel import ContainerViewModel
 from app.ui.dialogs.container_details_dialog import ContainerDetailsDialog
+from app.ui.tabs.resource_table_model import ResourceTableModel, create_filter_proxy
+
+# Row background by status keyword, checked in order
+_STATUS_COLORS = (
+    (("running",), Qt.green),
+    (("exited", "stopped"), Qt.red),
+    (("created",), Qt.yellow),
+)
 
 class ContainerTabView(QWidget):
     """View for displaying and managing Docker containers."""
@@ -58,17 +67,22 @@ class ContainerTabView(QWidget):
         layout.addLayout(button_layout)
         
         # Create container table
-        self.container_table = QTableWidget(0, 5)  # Change from 4 to 5 columns
-        self.container_table.setHorizontalHeaderLabels(["Name", "Image", "Status", "Ports", "Context"])
+        self.container_model = ResourceTableModel(
+            ["Name", "Image", "Status", "Ports", "Context"],
+            self._container_cells, self._status_brush, self
+        )
+        self.container_table = QTableView()
+        self.container_proxy = create_filter_proxy(self.container_model)
+        self.container_table.setModel(self.container_proxy)
         self.container_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.container_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.container_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.container_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.container_table.setSelectionBehavior(QTableView.SelectRows)
+        self.container_table.setSelectionMode(QTableView.SingleSelection)
+        self.container_table.setEditTriggers(QTableView.NoEditTriggers)
         self.container_table.setAlternatingRowColors(True)
         self.container_table.verticalHeader().setVisible(False)
         
         # Connect selection change signal
-        self.container_table.itemSelectionChanged.connect(self.update_button_states)
+        self.container_table.selectionModel().selectionChanged.connect(self.update_button_states)
         
         # Connect double click signal
         self.container_table.doubleClicked.connect(self.on_table_double_clicked)
@@ -82,7 +96,7 @@ class ContainerTabView(QWidget):
         
     def update_button_states(self):
         """Enable/disable buttons based on selection state"""
-        has_selection = len(self.container_table.selectedItems()) > 0
+        has_selection = self.container_table.selectionModel().hasSelection()
         self.start_button.setEnabled(has_selection)
         self.stop_button.setEnabled(has_selection)
         self.delete_button.setEnabled(has_selection)
@@ -90,49 +104,20 @@ class ContainerTabView(QWidget):
         
     def add_container_row(self, container):
         """Add a container to the table."""
-        row = self.container_table.rowCount()
-        self.container_table.insertRow(row)
-        
-        # Name cell
-        name_item = QTableWidgetItem(container["name"])
-        name_item.setData(Qt.UserRole, container)  # Store container data
-        self.container_table.setItem(row, 0, name_item)
-        
-        # Image cell
-        image_item = QTableWidgetItem(container["image"] if "image" in container else "")
-        self.container_table.setItem(row, 1, image_item)
-        
-        # Status cell
-        status_item = QTableWidgetItem(container["status"] if "status" in container else "")
-        self.container_table.setItem(row, 2, status_item)
-        
-        # Ports cell
-        ports_text = self._format_ports(container.get("ports", {}))
-        ports_item = QTableWidgetItem(ports_text)
-        self.container_table.setItem(row, 3, ports_item)
-        
-        # Context cell (new)
-        context_item = QTableWidgetItem(container.get("context", "default"))
-        self.container_table.setItem(row, 4, context_item)
-        
-        # Set row color based on status
-        self._set_row_color(row, container.get("status", ""))
+        self.container_model.append_resource(container)
+    
+    def bulk_set_rows(self, containers):
+        """Replace the table contents with the given containers in one batch."""
+        self.container_model.set_resources(containers)
+        self.update_button_states()
     
     def clear_table(self):
         """Clear all containers from the table."""
-        self.container_table.setRowCount(0)
+        self.container_model.clear()
         
     def filter_table(self, search_text):
         """Filter the table based on search text."""
-        for row in range(self.container_table.rowCount()):
-            should_show = False
-            for col in range(self.container_table.columnCount()):
-                item = self.container_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.container_table.setRowHidden(row, not should_show)
+        self.container_proxy.setFilterFixedString(search_text)
     
     def on_operation_completed(self, success, message):
         """Handle operation completion."""
@@ -183,15 +168,11 @@ class ContainerTabView(QWidget):
     
     def get_selected_container(self):
         """Get the currently selected container's data."""
-        selected_rows = self.container_table.selectedItems()
+        selected_rows = self.container_table.selectionModel().selectedRows()
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        container_item = self.container_table.item(row, 0)
-        if container_item:
-            return container_item.data(Qt.UserRole)
-        return None
+        return self.container_model.resource(self.container_proxy.mapToSource(selected_rows[0]).row())
     
     def start_selected_container(self):
         """Start the selected container."""
@@ -276,16 +257,20 @@ class ContainerTabView(QWidget):
                 
         return ", ".join(result)
     
-    def _set_row_color(self, row, status):
-        """Set row color based on container status."""
-        for col in range(self.container_table.columnCount()):
-            item = self.container_table.item(row, col)
-            if not item:
-                continue
-                
-            if "running" in status.lower():
-                item.setBackground(Qt.green)
-            elif "exited" in status.lower() or "stopped" in status.lower():
-                item.setBackground(Qt.red)
-            elif "created" in status.lower():
-                item.setBackground(Qt.yellow)
+    def _container_cells(self, container):
+        """Return the display strings for a container row."""
+        return (
+            container["name"],
+            container["image"] if "image" in container else "",
+            container["status"] if "status" in container else "",
+            self._format_ports(container.get("ports", {})),
+            container.get("context", "default"),
+        )
+    
+    def _status_brush(self, container):
+        """Return the row background for a container's status."""
+        status = container.get("status", "").lower()
+        for keywords, color in _STATUS_COLORS:
+            if any(keyword in status for keyword in keywords):
+                return QBrush(color)
+        return None
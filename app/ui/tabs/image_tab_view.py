@@ -2,11 +2,12 @@
 Tab view for displaying and managing Docker images.
 """
 from typing import Dict, List
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableView, 
                            QPushButton, QHBoxLayout, QHeaderView, QMenu, QAction, QMessageBox, QInputDialog, QLineEdit)
 from PyQt5.QtCore import Qt, QPoint, pyqtSlot
 
 from app.ui.viewmodels.image_viewmodel import ImageViewModel
+from app.ui.tabs.resource_table_model import ResourceTableModel, create_filter_proxy
 
 class ImageTabView(QWidget):
     """View for displaying and managing Docker images."""
@@ -43,17 +44,21 @@ class ImageTabView(QWidget):
         layout.addLayout(button_layout)
         
         # Create image table
-        self.image_table = QTableWidget(0, 5)  # Change from 4 to 5 columns
-        self.image_table.setHorizontalHeaderLabels(["Repository", "Tag", "ID", "Size", "Context"])
+        self.image_model = ResourceTableModel(
+            ["Repository", "Tag", "ID", "Size", "Context"], self._image_cells, parent=self
+        )
+        self.image_table = QTableView()
+        self.image_proxy = create_filter_proxy(self.image_model)
+        self.image_table.setModel(self.image_proxy)
         self.image_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.image_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.image_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.image_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.image_table.setSelectionBehavior(QTableView.SelectRows)
+        self.image_table.setSelectionMode(QTableView.SingleSelection)
+        self.image_table.setEditTriggers(QTableView.NoEditTriggers)
         self.image_table.setAlternatingRowColors(True)
         self.image_table.verticalHeader().setVisible(False)
         
         # Connect selection change signal
-        self.image_table.itemSelectionChanged.connect(self.update_button_states)
+        self.image_table.selectionModel().selectionChanged.connect(self.update_button_states)
         
         # Connect context menu
         self.image_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -69,59 +74,25 @@ class ImageTabView(QWidget):
     
     def update_button_states(self):
         """Enable/disable buttons based on selection state"""
-        has_selection = len(self.image_table.selectedItems()) > 0
+        has_selection = self.image_table.selectionModel().hasSelection()
         self.delete_button.setEnabled(has_selection)
     
     def add_image_row(self, image):
         """Add an image to the table."""
-        row = self.image_table.rowCount()
-        self.image_table.insertRow(row)
-        
-        # Parse repo and tag
-        name = image.get("name", "")
-        tags = image.get("tags", [])
-        tag = tags[0] if tags else "latest"
-        
-        # Repository cell
-        repo_item = QTableWidgetItem(name)
-        repo_item.setData(Qt.UserRole, image)  # Store image data
-        self.image_table.setItem(row, 0, repo_item)
-        
-        # Tag cell
-        tag_item = QTableWidgetItem(tag)
-        self.image_table.setItem(row, 1, tag_item)
-        
-        # ID cell (shortened)
-        id_val = image.get("id", "")
-        id_short = id_val[:12] if id_val else ""
-        id_item = QTableWidgetItem(id_short)
-        self.image_table.setItem(row, 2, id_item)
-        
-        # Size cell (formatted)
-        size = image.get("size", 0)
-        size_str = self._format_size(size)
-        size_item = QTableWidgetItem(size_str)
-        self.image_table.setItem(row, 3, size_item)
-        
-        # Context cell (new)
-        context_item = QTableWidgetItem(image.get("context", "default"))
-        self.image_table.setItem(row, 4, context_item)
+        self.image_model.append_resource(image)
+    
+    def bulk_set_rows(self, images):
+        """Replace the table contents with the given images in one batch."""
+        self.image_model.set_resources(images)
+        self.update_button_states()
     
     def clear_table(self):
         """Clear all images from the table."""
-        self.image_table.setRowCount(0)
-        
+        self.image_model.clear()
+    
     def filter_table(self, search_text):
         """Filter the table based on search text."""
-        for row in range(self.image_table.rowCount()):
-            should_show = False
-            for col in range(self.image_table.columnCount()):
-                item = self.image_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.image_table.setRowHidden(row, not should_show)
+        self.image_proxy.setFilterFixedString(search_text)
     
     def on_error(self, message):
         """Handle errors from the viewmodel."""
@@ -172,15 +143,11 @@ class ImageTabView(QWidget):
     
     def get_selected_image(self):
         """Get the currently selected image's data."""
-        selected_rows = self.image_table.selectedItems()
+        selected_rows = self.image_table.selectionModel().selectedRows()
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        image_item = self.image_table.item(row, 0)
-        if image_item:
-            return image_item.data(Qt.UserRole)
-        return None
+        return self.image_model.resource(self.image_proxy.mapToSource(selected_rows[0]).row())
     
     def delete_selected_image(self):
         """Delete the selected image."""
@@ -236,3 +203,15 @@ class ImageTabView(QWidget):
             size_bytes /= 1024.0
             
         return f"{size_bytes:.2f} PB"
+    
+    def _image_cells(self, image):
+        """Return the display strings for an image row."""
+        tags = image.get("tags", [])
+        id_val = image.get("id", "")
+        return (
+            image.get("name", ""),
+            tags[0] if tags else "latest",
+            id_val[:12] if id_val else "",
+            self._format_size(image.get("size", 0)),
+            image.get("context", "default"),
+        )
@@ -1,10 +1,11 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableView, 
                            QHeaderView, QPushButton, QHBoxLayout, QMenu, QAction, 
                            QMessageBox, QInputDialog, QLineEdit, QDialog, QFormLayout, QComboBox)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QCursor
 
 from app.ui.viewmodels.network_viewmodel import NetworkViewModel
+from app.ui.tabs.resource_table_model import ResourceTableModel, create_filter_proxy
 
 class CreateNetworkDialog(QDialog):
     """Dialog for creating a new network."""
@@ -65,11 +66,15 @@ class NetworkTabView(QWidget):
         layout = QVBoxLayout(self)
         
         # Create network table
-        self.network_table = QTableWidget(0, 5)
-        self.network_table.setHorizontalHeaderLabels(["Name", "ID", "Driver", "Scope", "Context"])
+        self.network_model = ResourceTableModel(
+            ["Name", "ID", "Driver", "Scope", "Context"], self._network_cells, parent=self
+        )
+        self.network_table = QTableView()
+        self.network_proxy = create_filter_proxy(self.network_model)
+        self.network_table.setModel(self.network_proxy)
         
         # Make columns resizable
-        for i in range(self.network_table.columnCount()):
+        for i in range(self.network_model.columnCount()):
             self.network_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Interactive)
         
         # Make name column stretch by default
@@ -86,10 +91,10 @@ class NetworkTabView(QWidget):
         """)
         
         # Set table behaviors
-        self.network_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.network_table.setSelectionBehavior(QTableView.SelectRows)
         self.network_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.network_table.customContextMenuRequested.connect(self.show_context_menu)
-        self.network_table.itemSelectionChanged.connect(self.update_button_states)
+        self.network_table.selectionModel().selectionChanged.connect(self.update_button_states)
         
         # Create action buttons
         button_layout = QHBoxLayout()
@@ -112,52 +117,25 @@ class NetworkTabView(QWidget):
     
     def update_button_states(self):
         """Enable/disable buttons based on selection state"""
-        has_selection = len(self.network_table.selectedItems()) > 0
+        has_selection = self.network_table.selectionModel().hasSelection()
         self.delete_button.setEnabled(has_selection)
         
     def add_network_row(self, network):
         """Add a network to the table."""
-        row = self.network_table.rowCount()
-        self.network_table.insertRow(row)
-        
-        # Name cell
-        name_item = QTableWidgetItem(network["name"])
-        name_item.setData(Qt.UserRole, network)  # Store network data
-        self.network_table.setItem(row, 0, name_item)
-        
-        # ID cell (shortened)
-        id_val = network.get("id", "")
-        id_short = id_val[:12] if id_val else ""
-        id_item = QTableWidgetItem(id_short)
-        self.network_table.setItem(row, 1, id_item)
-        
-        # Driver cell
-        driver_item = QTableWidgetItem(network.get("driver", ""))
-        self.network_table.setItem(row, 2, driver_item)
-        
-        # Scope cell
-        scope_item = QTableWidgetItem(network.get("scope", ""))
-        self.network_table.setItem(row, 3, scope_item)
-        
-        # Context cell (new)
-        context_item = QTableWidgetItem(network.get("context", "default"))
-        self.network_table.setItem(row, 4, context_item)
+        self.network_model.append_resource(network)
+    
+    def bulk_set_rows(self, networks):
+        """Replace the table contents with the given networks in one batch."""
+        self.network_model.set_resources(networks)
+        self.update_button_states()
     
     def clear_table(self):
         """Clear all networks from the table."""
-        self.network_table.setRowCount(0)
+        self.network_model.clear()
     
     def filter_table(self, search_text):
         """Filter the table based on search text."""
-        for row in range(self.network_table.rowCount()):
-            match = False
-            for col in range(self.network_table.columnCount()):
-                item = self.network_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match = True
-                    break
-            
-            self.network_table.setRowHidden(row, not match)
+        self.network_proxy.setFilterFixedString(search_text)
     
     def on_operation_completed(self, success, message):
         """Handle operation completion."""
@@ -179,15 +157,11 @@ class NetworkTabView(QWidget):
     
     def get_selected_network(self):
         """Get the currently selected network's data."""
-        selected_rows = self.network_table.selectedItems()
+        selected_rows = self.network_table.selectionModel().selectedRows()
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        network_item = self.network_table.item(row, 0)
-        if network_item:
-            return network_item.data(Qt.UserRole)
-        return None
+        return self.network_model.resource(self.network_proxy.mapToSource(selected_rows[0]).row())
     
     def create_network(self):
         """Create a new network."""
@@ -223,3 +197,14 @@ class NetworkTabView(QWidget):
         
         if confirm == QMessageBox.Yes:
             self.viewmodel.remove_network(network_name, context)
+    
+    def _network_cells(self, network):
+        """Return the display strings for a network row."""
+        id_val = network.get("id", "")
+        return (
+            network["name"],
+            id_val[:12] if id_val else "",
+            network.get("driver", ""),
+            network.get("scope", ""),
+            network.get("context", "default"),
+        )
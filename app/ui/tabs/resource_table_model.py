@@ -0,0 +1,77 @@
+"""
+Table model shared by the resource tab views.
+"""
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QVariant
+
+
+class ResourceTableModel(QAbstractTableModel):
+    """Read-only table of Docker resources stored column by column."""
+
+    def __init__(self, headers, row_fn, background_fn=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._row_fn = row_fn  # Maps a resource dict to a tuple of cell strings
+        self._background_fn = background_fn  # Optional resource dict -> row brush
+        self._resources = []
+        self._cols = [[] for _ in self._headers]
+        self._backgrounds = []
+
+    def set_resources(self, resources):
+        """Replace all rows with the given resources."""
+        self.beginResetModel()
+        self._resources = list(resources)
+        rows = [self._row_fn(resource) for resource in self._resources]
+        self._cols = [list(col) for col in zip(*rows)] if rows else [[] for _ in self._headers]
+        if self._background_fn:
+            self._backgrounds = [self._background_fn(resource) for resource in self._resources]
+        self.endResetModel()
+
+    def append_resource(self, resource):
+        """Add a single resource at the end of the table."""
+        row = len(self._resources)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._resources.append(resource)
+        for col, value in zip(self._cols, self._row_fn(resource)):
+            col.append(value)
+        if self._background_fn:
+            self._backgrounds.append(self._background_fn(resource))
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all rows."""
+        self.set_resources([])
+
+    def resource(self, row):
+        """Return the resource dict shown in the given row."""
+        return self._resources[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._resources)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DisplayRole:
+            return self._cols[index.column()][index.row()]
+        if role == Qt.UserRole:
+            return self._resources[index.row()]
+        if role == Qt.BackgroundRole and self._background_fn:
+            return self._backgrounds[index.row()]
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return QVariant()
+
+
+def create_filter_proxy(model):
+    """Wrap a model in a proxy that filters rows on any column, ignoring case."""
+    proxy = QSortFilterProxyModel(model.parent())
+    proxy.setSourceModel(model)
+    proxy.setFilterKeyColumn(-1)
+    proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+    return proxy
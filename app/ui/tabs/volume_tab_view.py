@@ -1,10 +1,11 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, 
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QTableView, 
                            QHeaderView, QPushButton, QHBoxLayout, QMenu, QAction, 
                            QMessageBox, QInputDialog, QLineEdit, QDialog, QFormLayout)
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QCursor
 
 from app.ui.viewmodels.volume_viewmodel import VolumeViewModel
+from app.ui.tabs.resource_table_model import ResourceTableModel, create_filter_proxy
 
 class CreateVolumeDialog(QDialog):
     """Dialog for creating a new volume."""
@@ -65,11 +66,15 @@ class VolumeTabView(QWidget):
         layout = QVBoxLayout(self)
         
         # Create volume table
-        self.volume_table = QTableWidget(0, 4)
-        self.volume_table.setHorizontalHeaderLabels(["Name", "Driver", "Mountpoint", "Context"])
+        self.volume_model = ResourceTableModel(
+            ["Name", "Driver", "Mountpoint", "Context"], self._volume_cells, parent=self
+        )
+        self.volume_table = QTableView()
+        self.volume_proxy = create_filter_proxy(self.volume_model)
+        self.volume_table.setModel(self.volume_proxy)
         
         # Make columns resizable
-        for i in range(self.volume_table.columnCount()):
+        for i in range(self.volume_model.columnCount()):
             self.volume_table.horizontalHeader().setSectionResizeMode(i, QHeaderView.Interactive)
         
         # Make name column stretch by default
@@ -87,10 +92,10 @@ class VolumeTabView(QWidget):
         """)
         
         # Set table behaviors
-        self.volume_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.volume_table.setSelectionBehavior(QTableView.SelectRows)
         self.volume_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.volume_table.customContextMenuRequested.connect(self.show_context_menu)
-        self.volume_table.itemSelectionChanged.connect(self.update_button_states)
+        self.volume_table.selectionModel().selectionChanged.connect(self.update_button_states)
         
         # Create action buttons
         button_layout = QHBoxLayout()
@@ -113,46 +118,25 @@ class VolumeTabView(QWidget):
     
     def update_button_states(self):
         """Enable/disable buttons based on selection state"""
-        has_selection = len(self.volume_table.selectedItems()) > 0
+        has_selection = self.volume_table.selectionModel().hasSelection()
         self.delete_button.setEnabled(has_selection)
         
     def add_volume_row(self, volume):
         """Add a volume to the table."""
-        row = self.volume_table.rowCount()
-        self.volume_table.insertRow(row)
-        
-        # Name cell
-        name_item = QTableWidgetItem(volume["name"])
-        name_item.setData(Qt.UserRole, volume)  # Store volume data
-        self.volume_table.setItem(row, 0, name_item)
-        
-        # Driver cell
-        driver_item = QTableWidgetItem(volume.get("driver", "local"))
-        self.volume_table.setItem(row, 1, driver_item)
-        
-        # Mountpoint cell
-        mountpoint_item = QTableWidgetItem(volume.get("mountpoint", ""))
-        self.volume_table.setItem(row, 2, mountpoint_item)
-        
-        # Context cell (new)
-        context_item = QTableWidgetItem(volume.get("context", "default"))
-        self.volume_table.setItem(row, 3, context_item)
+        self.volume_model.append_resource(volume)
+    
+    def bulk_set_rows(self, volumes):
+        """Replace the table contents with the given volumes in one batch."""
+        self.volume_model.set_resources(volumes)
+        self.update_button_states()
     
     def clear_table(self):
         """Clear all volumes from the table."""
-        self.volume_table.setRowCount(0)
+        self.volume_model.clear()
     
     def filter_table(self, search_text):
         """Filter the table based on search text."""
-        for row in range(self.volume_table.rowCount()):
-            match = False
-            for col in range(self.volume_table.columnCount()):
-                item = self.volume_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    match = True
-                    break
-            
-            self.volume_table.setRowHidden(row, not match)
+        self.volume_proxy.setFilterFixedString(search_text)
     
     def on_operation_completed(self, success, message):
         """Handle operation completion."""
@@ -174,15 +158,11 @@ class VolumeTabView(QWidget):
     
     def get_selected_volume(self):
         """Get the currently selected volume's data."""
-        selected_rows = self.volume_table.selectedItems()
+        selected_rows = self.volume_table.selectionModel().selectedRows()
         if not selected_rows:
             return None
         
-        row = selected_rows[0].row()
-        volume_item = self.volume_table.item(row, 0)
-        if volume_item:
-            return volume_item.data(Qt.UserRole)
-        return None
+        return self.volume_model.resource(self.volume_proxy.mapToSource(selected_rows[0]).row())
     
     def create_volume(self):
         """Create a new volume."""
@@ -218,3 +198,12 @@ class VolumeTabView(QWidget):
         
         if confirm == QMessageBox.Yes:
             self.viewmodel.remove_volume(volume_name, context)
+    
+    def _volume_cells(self, volume):
+        """Return the display strings for a volume row."""
+        return (
+            volume["name"],
+            volume.get("driver", "local"),
+            volume.get("mountpoint", ""),
+            volume.get("context", "default"),
+        )
@@ -0,0 +1,45 @@
+"""Background writer for persisting QSettings off the GUI thread."""
+from PyQt5.QtCore import QMutex, QMutexLocker, QSettings, QThread, QWaitCondition
+
+
+class SettingsWriter(QThread):
+    """Owns a QSettings instance and writes queued values on its own thread."""
+
+    def __init__(self, organization, application, parent=None):
+        super().__init__(parent)
+        self.setObjectName("settings_writer")
+        self._organization = organization
+        self._application = application
+        self._pending = {}  # Coalesced writes, last value per key wins
+        self._stopping = False
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+
+    def write(self, values):
+        """Queue a dict of key/value pairs to be written."""
+        with QMutexLocker(self._mutex):
+            self._pending.update(values)
+            self._wake.wakeOne()
+
+    def stop(self):
+        """Write any remaining values and stop the thread; safe to call more than once."""
+        with QMutexLocker(self._mutex):
+            self._stopping = True
+            self._wake.wakeOne()
+        self.wait()
+
+    def run(self):
+        """Wait for queued values and write them in batches."""
+        settings = QSettings(self._organization, self._application)
+        while True:
+            with QMutexLocker(self._mutex):
+                while not self._pending and not self._stopping:
+                    self._wake.wait(self._mutex)
+                batch, self._pending = self._pending, {}
+
+            if not batch:
+                break
+
+            for key, value in batch.items():
+                settings.setValue(key, value)
+            settings.sync()
@@ -66,11 +66,20 @@ class MainViewModel(QObject):
         return self.docker_service.get_current_context()
         
     @pyqtSlot()
-    def refresh_all_resources(self):
+    def refresh_all_resources(self, refresh_contexts=True):
         """Refresh all Docker resources and emit appropriate signals"""
         # First, invalidate contexts cache to ensure fresh data
         self.invalidate_contexts_cache()
         
+        # Reload contexts once; the listings below reuse the refreshed cache
+        if refresh_contexts:
+            self.log("Refreshing Docker contexts...")
+            contexts, error = self.get_docker_contexts()
+            if error:
+                self.report_error(f"Error refreshing Docker contexts: {error}")
+            else:
+                self.log(f"Found {len(contexts)} Docker contexts")
+        
         # Get current context
         current_context = self.get_current_context()
         
@@ -1,61 +1,77 @@
 """Worker for refreshing Docker data in a background thread."""
+import threading
 import traceback
-import sys
 from typing import Dict, List, Tuple
-from PyQt5.QtCore import pyqtSignal, QThread, QObject, QTimer  # Add QTimer import
+from PyQt5.QtCore import pyqtSignal, QObject, QRunnable
 
 from app.core.services.docker_service import DockerService
 
 class WorkerSignals(QObject):
     """Signals for the worker thread."""
+    results_ready = pyqtSignal(list, list, list, list, list, str)  # ..., contexts, error
     error = pyqtSignal(str)  # Changed from tuple to str to avoid traceback issues
     log = pyqtSignal(str)
     finished = pyqtSignal()  # Signal to indicate thread completion
 
-class RefreshWorker(QThread):
-    """Worker thread for refreshing Docker data."""
-    
-    results_ready = pyqtSignal(list, list, list, list, str)
-    
-    def __init__(self, docker_service: DockerService):
+class RefreshWorker(QRunnable):
+    """Refreshes Docker data on the global thread pool."""
+
+    def __init__(self, docker_service: DockerService, fetch_contexts: bool = True):
         """Initialize the refresh worker with the Docker service."""
         super().__init__()
         self.docker_service = docker_service
+        self.fetch_contexts = fetch_contexts
         self.signals = WorkerSignals()
-        self.is_running = False
-    
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Ask the worker to stop before its next fetch; results are then dropped."""
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        """Return whether cancel() has been called."""
+        return self._cancelled.is_set()
+
     def run(self):
         """Execute the refresh operation."""
-        self.is_running = True
         try:
-            # Fetch all Docker resources
-            self.signals.log.emit("Fetching containers...")
-            containers = self.docker_service.list_containers(True)
-            
-            self.signals.log.emit("Fetching images...")
-            images = self.docker_service.list_images()
-            
-            self.signals.log.emit("Fetching volumes...")
-            volumes = self.docker_service.list_volumes()
-            
-            self.signals.log.emit("Fetching networks...")
-            networks = self.docker_service.list_networks()
-            
+            # Fetch all Docker resources, checking for cancellation between calls
+            fetches = (
+                ("containers", lambda: self.docker_service.list_containers(True)),
+                ("images", self.docker_service.list_images),
+                ("volumes", self.docker_service.list_volumes),
+                ("networks", self.docker_service.list_networks),
+            )
+            results = []
+            for name, fetch in fetches:
+                if self.is_cancelled():
+                    return
+                self.signals.log.emit(f"Fetching {name}...")
+                results.append(fetch())
+
+            # Contexts come along with the resources so the UI needs no separate round trip
+            contexts = []
+            if self.fetch_contexts and not self.is_cancelled():
+                self.signals.log.emit("Fetching contexts...")
+                contexts, error = self.docker_service.get_docker_contexts()
+                if error:
+                    self.signals.log.emit(f"Error refreshing Docker contexts: {error}")
+                    contexts = []
+
             # Emit results
-            self.results_ready.emit(containers, images, volumes, networks, "")
-        
+            if not self.is_cancelled():
+                self.signals.results_ready.emit(*results, contexts, "")
+
         except Exception as e:
             error_msg = f"Error refreshing Docker data: {str(e)}"
-            self.signals.log.emit(error_msg)
-            self.signals.error.emit(error_msg)
-            self.results_ready.emit([], [], [], [], error_msg)
-            import traceback
             traceback.print_exc()
-        
-        finally:
-            QTimer.singleShot(100, self._finalize)
+            if not self.is_cancelled():
+                self.signals.log.emit(error_msg)
+                self.signals.error.emit(error_msg)
+                self.signals.results_ready.emit([], [], [], [], [], error_msg)
 
-    def _finalize(self):
-        """Finalize the thread after a short delay to ensure signal processing."""
-        self.is_running = False
-        self.signals.finished.emit()
+        finally:
+            try:
+                self.signals.finished.emit()
+            except RuntimeError:
+                pass  # Application shut down while the refresh was running
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.core.docker.installation.steps import linux_steps
+from app.core.docker.installation.steps.linux_steps import DetectDistroStep, DockerPackageStep
+
+class TestLinuxSteps(unittest.TestCase):
+    """Test Linux distribution detection and script generation."""
+    
+    def setUp(self):
+        """Reset the shared distro cache and create a scratch directory."""
+        DetectDistroStep._distro_cache = None
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.os_release = os.path.join(self.temp_dir.name, "os-release")
+    
+    def tearDown(self):
+        """Clean up the scratch directory and cache."""
+        DetectDistroStep._distro_cache = None
+        self.temp_dir.cleanup()
+    
+    def test_detect_distro_reads_os_release_once(self):
+        """Test the distro is parsed from os-release and cached."""
+        with open(self.os_release, "w") as f:
+            f.write('NAME="Ubuntu"\nID=ubuntu\nVERSION_ID="22.04"\n')
+        
+        with patch.object(linux_steps, "_OS_RELEASE_PATH", self.os_release):
+            self.assertEqual(DetectDistroStep.detect_distro(), "ubuntu")
+            os.remove(self.os_release)
+            self.assertEqual(DetectDistroStep.detect_distro(), "ubuntu")
+    
+    def test_detect_distro_without_release_files(self):
+        """Test detection falls back to 'unknown' when nothing is found."""
+        with patch.object(linux_steps, "_OS_RELEASE_PATH", self.os_release), \
+             patch.object(linux_steps, "_DISTRO_FALLBACKS", ()):
+            self.assertEqual(DetectDistroStep.detect_distro(), "unknown")
+    
+    def test_build_script_options(self):
+        """Test the install script only includes the requested options."""
+        step = DockerPackageStep(MagicMock(), "fedora", add_user=False, auto_start=True)
+        script = step._build_script()
+        self.assertIn("dnf install", script)
+        self.assertIn("systemctl start docker", script)
+        self.assertNotIn("usermod", script)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,8 @@ from app.core.docker.installation.steps.base import InstallationStep
 from app.core.docker.installation.steps.windows_steps import WindowsWSL2Step
 from app.core.docker.installation.steps.mac_steps import (
     HomebrewInstallStep, DockerCLIInstallStep, ColimaInstallStep,
-    ColimaStartStep, DesktopDownloadStep, DesktopInstallStep
+    ColimaStartStep, DesktopDownloadStep, DesktopInstallStep,
+    BrewFormulaeInstallStep
 )
 
 class MockWorker:
@@ -120,19 +121,25 @@ class TestStepRollback(unittest.TestCase):
         self.assertEqual(message, "Installation cancelled by user")
 
     @unittest.skipIf(platform.system().lower() != "windows", "Windows-specific test")
+    @patch("subprocess.Popen")
     @patch("subprocess.run")
-    def test_windows_wsl2_step(self, mock_run):
+    def test_windows_wsl2_step(self, mock_run, mock_popen):
         """Test Windows WSL2 step execution and rollback."""
         # Mock the subprocess.run to simulate WSL not being installed
         mock_run.return_value.stdout = ""
         mock_run.return_value.stderr = ""
+        process = mock_popen.return_value.__enter__.return_value
+        process.stdout = iter([])
+        process.wait.return_value = 0
         
         # Create and execute the WSL2 step
         wsl_step = WindowsWSL2Step(self.worker)
         wsl_step.execute()
         
-        # Verify commands were executed to enable WSL2
-        self.assertEqual(mock_run.call_count, 4)  # Status check + 3 setup commands
+        # Verify the status check ran and setup was batched into one PowerShell process
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual(mock_popen.call_count, 1)
+        self.assertEqual(mock_popen.call_args[0][0][0], "powershell.exe")
         
         # Test rollback
         wsl_step.rollback()
@@ -181,5 +188,22 @@ class TestStepRollback(unittest.TestCase):
         self.assertTrue(install_call)
         self.assertTrue(uninstall_call)
 
+    @patch("subprocess.run")
+    @patch("subprocess.Popen")
+    def test_brew_formulae_single_invocation(self, mock_popen, mock_run):
+        """Test Homebrew formulae are installed and rolled back in one call each."""
+        process = mock_popen.return_value.__enter__.return_value
+        process.stdout = iter(["==> Downloading docker\n", "==> Pouring colima\n"])
+        process.returncode = 0
+        
+        step = BrewFormulaeInstallStep(self.worker, ("docker", "colima"))
+        step.execute()
+        step.rollback()
+        
+        mock_popen.assert_called_once()
+        self.assertEqual(mock_popen.call_args[0][0], ["brew", "install", "docker", "colima"])
+        mock_run.assert_called_once_with(["brew", "uninstall", "docker", "colima"], check=False)
+        self.worker.progress_updated.emit.assert_called_with(50, "Homebrew packages installed")
+
 if __name__ == "__main__":
     unittest.main()